@@ -1,27 +1,94 @@
 import sys
 import os
-from PyQt6.QtCore import QObject, pyqtSlot
+import time
+from PyQt6.QtCore import QObject, QThread, pyqtSlot
 from model.launcher_model import AppModel
 from controller.search_controller import SearchController
+from controller.search_scheduler import SearchScheduler
 from view.launcher_view import LauncherView
+from worker.worker_app_catalog import AppCatalogWorker
+from worker.worker_icon_loader import IconLoader
 
 class RiwingLauncher(QObject):
-    def __init__(self):
+    def __init__(self, startup_timing: bool = False, cold_start: bool = False):
         super().__init__()
+        self.startup_timing = startup_timing
+        self._startup_begin = time.perf_counter()
         
         self.model = AppModel()
         self.controller = SearchController(self.model)
+        self.scheduler = SearchScheduler(self.controller)
         self.view = LauncherView()
+        self.icon_loader = IconLoader(self.model)
+        self.view.results_list.set_icon_loader(self.icon_loader)
         
-        self.view.search_requested.connect(self.on_search_requested)
+        self.view.search_requested.connect(self.scheduler.schedule)
+        self.scheduler.results_ready.connect(self.on_results_ready)
         self.view.item_executed.connect(self.controller.execute_item)
         
-        self.model.load_installed_apps()
+        self.setup_catalog_thread()
+        
+        self._startup_mode = "cold"
+        self._streaming = True
+        if not cold_start and self.model.load_cached_apps():
+            self._startup_mode = "warm"
+            self._streaming = False
+            self.report_timing("snapshot carregado")
+        
+        self.catalog_thread.start()
+        self.model.file_index.start()
+        if self.model.content_index:
+            self.model.content_index.start()
+        
+        self.refresh_view()
+    
+    def setup_catalog_thread(self):
+        self.catalog_thread = QThread()
+        self.catalog_worker = AppCatalogWorker(self.model)
+        self.catalog_worker.moveToThread(self.catalog_thread)
+        
+        self.catalog_thread.started.connect(self.catalog_worker.run)
+        self.catalog_worker.partial.connect(self.on_catalog_partial)
+        self.catalog_worker.result.connect(self.on_catalog_loaded)
+        self.catalog_worker.result.connect(self.catalog_thread.quit)
+    
+    def on_catalog_partial(self, apps, search_index):
+        if not self._streaming or not apps:
+            return
+        first = not self.model.apps_cache
+        self.model.publish_apps(apps, search_index)
+        if first:
+            self.report_timing("primeiros resultados")
+        self.refresh_view()
+    
+    def on_catalog_loaded(self, apps, search_index):
+        self._streaming = False
+        if apps:
+            self.model.publish_apps(apps, search_index)
+            self.refresh_view()
+        self.report_timing("catálogo completo")
+    
+    def refresh_view(self):
+        # Escondida, a janela mantém a lista padrão atualizada para o atalho
+        # já abrir com os resultados prontos.
+        self.scheduler.schedule(self.view.search_input.text() if self.view.isVisible() else "")
+    
+    def report_timing(self, stage: str):
+        if not self.startup_timing:
+            return
+        elapsed = (time.perf_counter() - self._startup_begin) * 1000
+        print(f"[startup:{self._startup_mode}] {stage}: {elapsed:.1f} ms ({len(self.model.apps_cache)} apps)")
    
-    @pyqtSlot(str)
-    def on_search_requested(self, query: str):
-        results = self.controller.search(query)
+    @pyqtSlot(str, list)
+    def on_results_ready(self, query: str, results: list):
         self.view.update_results(results)
    
     def cleanup(self):
-        self.model.cleanup()
\ No newline at end of file
+        self.scheduler.shutdown()
+        self.controller.shutdown()
+        if self.catalog_thread.isRunning():
+            self.catalog_thread.quit()
+            self.catalog_thread.wait()
+        self.icon_loader.shutdown()
+        self.model.save_snapshot()
+        self.model.cleanup()
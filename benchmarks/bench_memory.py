@@ -0,0 +1,72 @@
+"""Memória por entrada dos registros do catálogo e do índice de arquivos.
+
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --files 100000 --apps 100000
+"""
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_search import synthetic_apps, synthetic_tree
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, used
+
+def file_index_memory(count: int) -> float:
+    from model.file_index import FileIndex
+    tree = tempfile.mkdtemp(prefix="riwing-mem-")
+    try:
+        synthetic_tree(tree, count)
+
+        def build():
+            index = FileIndex([tree], max_depth=3, poll_interval=60.0)
+            index.start()
+            index.ready.wait(120)
+            len(index)
+            return index
+
+        index, used = measure(build)
+        entries = len(index)
+        index.stop()
+        return used / entries
+    finally:
+        shutil.rmtree(tree, ignore_errors=True)
+
+def catalog_memory(count: int) -> float:
+    from model.search_index import SearchIndex
+    from model.launcher_model import app_folded
+
+    def build():
+        apps = synthetic_apps(count)
+        return apps, SearchIndex(apps, folded_key=app_folded)
+
+    _, used = measure(build)
+    return used / count
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por entrada do Riwing")
+    parser.add_argument("--files", type=int, default=100000)
+    parser.add_argument("--apps", type=int, default=100000)
+    args = parser.parse_args()
+
+    os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp(prefix="riwing-mem-cache-")
+    try:
+        print(f"índice de arquivos ({args.files}): {file_index_memory(args.files):.0f} bytes/entrada")
+        print(f"catálogo + SearchIndex ({args.apps}): {catalog_memory(args.apps):.0f} bytes/app")
+    finally:
+        shutil.rmtree(os.environ["XDG_CACHE_HOME"], ignore_errors=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Benchmark headless da busca do launcher.
+
+Monta catálogos sintéticos de AppInfo e uma árvore de arquivos sintética,
+reproduz sequências de teclas em SearchController.search e mede latência
+(p50/p95/p99) e alocações por tecla. Roda no Linux sem winreg e com Qt
+offscreen.
+
+    python benchmarks/bench_search.py                  # compara com o baseline
+    python benchmarks/bench_search.py --update-baseline
+    python benchmarks/bench_search.py --sizes 100 10000 --threshold 0.5
+
+Sai com código 1 se o p95 de latência ou de alocação de algum cenário
+piorar mais que o limite em relação ao baseline salvo.
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+DEFAULT_SIZES = [100, 10000, 100000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+FILE_TREE_SIZE = 5000
+
+WORDS = [
+    "visual", "studio", "code", "chrome", "firefox", "office", "word", "excel", "power",
+    "point", "adobe", "reader", "photo", "shop", "media", "player", "steam", "discord",
+    "spotify", "notepad", "terminal", "python", "java", "git", "docker", "node", "game",
+    "launcher", "manager", "editor", "viewer", "studio", "tools", "cloud", "drive", "sync",
+    "music", "video", "paint", "calc", "mail", "calendar", "browser", "server", "client",
+]
+EXTENSIONS = [".txt", ".pdf", ".docx", ".xlsx", ".png", ".jpg", ".py", ".md", ".zip"]
+
+KEYSTROKES = {
+    "apps": ["visual studio", "chrome", "spotify", "xq", "power point", "ste"],
+    "files": ["?report", "?invoice 2023", "?photo", "?zzz"],
+    "math": ["12*(3+4)^2", "sqrt(2)/3", "2^64-1"],
+}
+
+def synthetic_apps(count: int, seed: int = 1):
+    from model.launcher_model import AppInfo
+    rng = random.Random(seed)
+    apps = []
+    for i in range(count):
+        name = " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(1, 3)))
+        apps.append(AppInfo(f"{name} {i}" if i >= len(WORDS) else name,
+                            f"C:\\Program Files\\{name}\\app{i}.exe"))
+    return apps
+
+def synthetic_tree(root: str, count: int = FILE_TREE_SIZE, seed: int = 2):
+    rng = random.Random(seed)
+    dirs = [root]
+    for i in range(count):
+        if i % 50 == 0:
+            parent = rng.choice(dirs)
+            if parent.count(os.sep) - root.count(os.sep) < 3:
+                path = os.path.join(parent, f"{rng.choice(WORDS)}_{i}")
+                os.makedirs(path, exist_ok=True)
+                dirs.append(path)
+        name = f"{rng.choice(WORDS)} {rng.choice(['report', 'invoice', 'notes', 'photo'])} {2015 + i % 10}"
+        with open(os.path.join(rng.choice(dirs), name + rng.choice(EXTENSIONS)), "w") as f:
+            f.write("x")
+
+def prefixes(query: str):
+    start = 2 if query.startswith("?") else 1
+    return [query[:i] for i in range(start, len(query) + 1)]
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+def replay(controller, queries, rounds: int):
+    latencies = []
+    for _ in range(rounds):
+        for query in queries:
+            for text in prefixes(query):
+                start = time.perf_counter_ns()
+                controller.search(text)
+                latencies.append((time.perf_counter_ns() - start) / 1e6)
+
+    # Alocações numa passada separada: tracemalloc distorce a latência.
+    allocations = []
+    tracemalloc.start()
+    for query in queries:
+        for text in prefixes(query):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            controller.search(text)
+            allocations.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+    tracemalloc.stop()
+
+    return {
+        "keystrokes": len(latencies),
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "alloc_p50_kb": percentile(allocations, 0.50),
+        "alloc_p95_kb": percentile(allocations, 0.95),
+    }
+
+def setup_environment(work_dir: str) -> str:
+    tree = os.path.join(work_dir, "files")
+    os.makedirs(tree)
+    synthetic_tree(tree)
+
+    # Dados do app (histórico, índices, configurações) ficam no diretório temporário.
+    os.environ["XDG_CACHE_HOME"] = os.path.join(work_dir, "cache")
+    from model.storage import get_data_dir
+    with open(os.path.join(get_data_dir(), "settings.json"), "w", encoding="utf-8") as f:
+        json.dump({"file_search": {"roots": [tree], "depth": 3},
+                   "content_search": {"enabled": False}}, f)
+    return tree
+
+def run(sizes, rounds: int) -> dict:
+    work_dir = tempfile.mkdtemp(prefix="riwing-bench-")
+    try:
+        setup_environment(work_dir)
+        from model.launcher_model import AppModel
+        from controller.search_controller import SearchController
+
+        model = AppModel()
+        model.file_index.start()
+        if not model.file_index.ready.wait(30):
+            raise RuntimeError("índice de arquivos não ficou pronto")
+
+        report = {}
+        try:
+            for size in sizes:
+                model.publish_apps(synthetic_apps(size))
+                controller = SearchController(model)
+                for scenario, queries in KEYSTROKES.items():
+                    name = f"{scenario}-{size}"
+                    report[name] = replay(controller, queries, rounds)
+                    print_row(name, report[name])
+                controller.shutdown()
+        finally:
+            model.cleanup()
+        return report
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def print_row(name: str, row: dict):
+    print(f"{name:<14} n={row['keystrokes']:<5} p50={row['p50_ms']:7.2f}ms p95={row['p95_ms']:7.2f}ms "
+          f"p99={row['p99_ms']:7.2f}ms alloc p50={row['alloc_p50_kb']:8.1f}KB p95={row['alloc_p95_kb']:8.1f}KB")
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, row in report.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ("p95_ms", "alloc_p95_kb"):
+            # Uma folga absoluta evita falso alarme em medidas de microssegundos.
+            allowed = base[metric] * (1 + threshold) + (0.05 if metric == "p95_ms" else 1.0)
+            if row[metric] > allowed:
+                regressions.append(f"{name} {metric}: {row[metric]:.2f} > {base[metric]:.2f} (+{threshold:.0%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless da busca do Riwing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.rounds)
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Baseline salvo em {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSÃO {line}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
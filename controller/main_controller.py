@@ -1,18 +1,26 @@
-from PyQt6.QtCore import QTimer, QObject, QThread
+from PyQt6.QtCore import QTimer, QObject, QThread, pyqtSignal
 from model.system_info import SystemInfo
 from model.media_detector import MediaDetector
+from model.media_backends import create_media_backend
+from model.metrics_collector import MetricsCollector
 from worker.worker_system_info import SystemInfoWorker
 from worker.worker_media_info import MediaInfoWorker
 
 class MainController(QObject):
+    media_changed = pyqtSignal()
+
     def __init__(self, topbar):
         super().__init__()
         self.topbar = topbar
         self.system_info = SystemInfo()
         self.media_detector = MediaDetector()
+        self.metrics = MetricsCollector()
+        self.topbar.set_metrics(self.metrics)
+        self._media_pending = False
 
         self.setup_system_thread()
         self.setup_media_thread()
+        self.setup_media_backend()
         self.setup_timers()
         self.update_all()
 
@@ -25,9 +33,9 @@ class MainController(QObject):
         self.system_timer.timeout.connect(self.start_system_worker)
         self.system_timer.start(2000)
 
-        self.media_timer = QTimer()
-        self.media_timer.timeout.connect(self.start_media_worker)
-        self.media_timer.start(3000)
+        self.metrics_timer = QTimer()
+        self.metrics_timer.timeout.connect(self.update_metrics)
+        self.metrics_timer.start(int(min(series.interval for series in self.metrics.series.values()) * 1000))
 
     def setup_system_thread(self):
         self.system_thread = QThread()
@@ -54,9 +62,26 @@ class MainController(QObject):
         self.media_thread.started.connect(self.media_worker.run)
         self.media_worker.result.connect(self.on_media_info_updated)
         self.media_worker.result.connect(self.media_thread.quit)
+        self.media_thread.finished.connect(self.on_media_thread_finished)
+
+    def setup_media_backend(self):
+        # O backend avisa da sua própria thread; o sinal chega enfileirado na
+        # thread da GUI e o worker só roda quando a faixa muda.
+        self.media_backend = create_media_backend(self.media_detector.probe)
+        self.media_detector.attach_backend(self.media_backend)
+        self.media_changed.connect(self.start_media_worker)
+        self.media_backend.subscribe(lambda media_info: self.media_changed.emit())
+        self.media_backend.start()
 
     def start_media_worker(self):
-        if not self.media_thread.isRunning():
+        if self.media_thread.isRunning():
+            self._media_pending = True
+        else:
+            self.media_thread.start()
+
+    def on_media_thread_finished(self):
+        if self._media_pending:
+            self._media_pending = False
             self.media_thread.start()
 
     def on_media_info_updated(self, media_text):
@@ -72,8 +97,14 @@ class MainController(QObject):
         except Exception as e:
             print(f"Erro ao atualizar informações de tempo: {e}")
 
+    def update_metrics(self):
+        self.metrics.collect()
+        self.topbar.update_network(self.metrics.network.up, self.metrics.network.down)
+        self.topbar.refresh_sparklines()
+
     def update_all(self):
         self.update_time_info()
+        self.update_metrics()
         self.start_system_worker()
         self.start_media_worker()
 
@@ -83,13 +114,16 @@ class MainController(QObject):
                 self.time_timer.stop()
             if hasattr(self, 'system_timer'):
                 self.system_timer.stop()
-            if hasattr(self, 'media_timer'):
-                self.media_timer.stop()
+            if hasattr(self, 'metrics_timer'):
+                self.metrics_timer.stop()
+            if hasattr(self, 'media_backend'):
+                self.media_backend.stop()
             if self.system_thread.isRunning():
                 self.system_thread.quit()
                 self.system_thread.wait()
             if self.media_thread.isRunning():
                 self.media_thread.quit()
                 self.media_thread.wait()
+            self.media_detector.close()
         except Exception as e:
             print(f"Erro durante cleanup: {e}")
@@ -1,50 +1,215 @@
 import os
+import math
+import time
+import threading
 import subprocess
 import webbrowser
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Optional, Union
 from model.launcher_model import AppModel, AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo, FolderInfo
+from model.search_index import fold
+from model.file_search import rank_key
+from controller.search_providers import SearchProvider, default_providers
+from model.tracing import get_tracer
+
+FRECENCY_WEIGHT = 20
+FILE_RESULTS = 8
+PUBLISH_INTERVAL = 0.03
+LATE_POLL_INTERVAL = 0.05
 
 class SearchController:
     def __init__(self, model: AppModel):
         self.model = model
+        self._apps_by_path = {}
+        self._apps_by_path_index = None
+        self._last_refinement = None
+        self._refinement_lock = threading.Lock()
+        self.tracer = get_tracer()
+        self.refinement_stats = {'incremental': 0, 'full': 0}
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="provider")
+        self.provider_stats = {}
+        self._stats_lock = threading.Lock()
+        self.providers = []
+        self._prefixed = []
+        for provider in default_providers(self):
+            self.register_provider(provider)
         
-    def search(self, query: str) -> List[Union[AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo]]:
-        if not query:
-            return self.model.apps_cache[:20]
+    def search(self, query: str, token=None, publish=None) -> List[Union[AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo]]:
+        with self.tracer.span("search", query_length=len(query)):
+            if not query:
+                return self.default_apps()
             
-        if query.startswith('.'):
-            return self.search_apps(query[1:])
-        elif query.startswith('?'):
-            return self.search_files(query[1:])
-        elif query.startswith('/'):
-            return self.search_web(query[1:])
-        elif query.startswith('!'):
-            return self.create_command(query[1:])
-        else:
-            math_result = self.model.evaluate_math(query)
-            if math_result:
-                return [math_result]
+            provider = self.route(query)
+            if provider is not None:
+                return self.run_provider(provider, query, token, publish)
+            return self.fan_out(query, token, publish)
+    
+    def register_provider(self, provider: SearchProvider):
+        self.providers.append(provider)
+        self._prefixed = sorted((p for p in self.providers if p.prefix),
+                                key=lambda p: len(p.prefix), reverse=True)
+    
+    def route(self, query: str) -> Optional[SearchProvider]:
+        for provider in self._prefixed:
+            if query.startswith(provider.prefix):
+                return provider
+        return None
+    
+    def run_provider(self, provider: SearchProvider, query: str, token=None, publish=None) -> list:
+        start = time.perf_counter()
+        try:
+            with self.tracer.span(f"provider:{provider.name}"):
+                results = provider.search(query, token, publish)
+        except Exception as e:
+            print(f"Erro no provedor {provider.name}: {e}")
+            results = []
+        elapsed = time.perf_counter() - start
+        
+        with self._stats_lock:
+            stats = self.provider_stats.setdefault(provider.name, {'calls': 0, 'late': 0, 'total': 0.0, 'max': 0.0})
+            stats['calls'] += 1
+            stats['total'] += elapsed
+            stats['max'] = max(stats['max'], elapsed)
+            if elapsed > provider.budget:
+                stats['late'] += 1
+        return results
+    
+    def fan_out(self, query: str, token=None, publish=None) -> list:
+        providers = [p for p in self.providers if p.fan_out and p.accepts(query)]
+        start = time.perf_counter()
+        finished = {}
+        futures = {}
+        for provider in providers:
+            future = self.executor.submit(self.run_provider, provider, query, token)
+            futures[future] = provider
+            # O instante de término é registrado na própria thread do provedor,
+            # sem depender de quando o laço abaixo acorda.
+            future.add_done_callback(lambda f: finished.setdefault(f, time.perf_counter()))
+        pending = set(futures)
+        results = {}
+        # Cada provedor que termina já publica o que há. Os que respondem dentro
+        # do próprio orçamento entram por prioridade; os atrasados são anexados
+        # no fim, na ordem em que terminam.
+        on_time = []
+        late = []
+        
+        while pending:
+            if token is not None and token.cancelled:
+                for future in pending:
+                    future.cancel()
+                return []
             
-            return self.search_apps(query)
+            done, pending = wait(pending, timeout=LATE_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            now = time.perf_counter()
+            for future in done:
+                finished.setdefault(future, now)
+            for future in sorted(done, key=finished.get):
+                provider = futures[future]
+                results[provider] = future.result()
+                (on_time if finished[future] - start <= provider.budget else late).append(provider)
+            if done and pending and publish:
+                merged = self.merge(results, on_time, late)
+                if merged:
+                    publish(merged)
+        
+        return self.merge(results, on_time, late)
+    
+    def merge(self, results: dict, on_time: list, late: list) -> list:
+        merged = []
+        seen = set()
+        for provider in sorted(on_time, key=lambda p: -p.priority) + late:
+            for item in results.get(provider, []):
+                key = (item.type, getattr(item, 'path', item.name))
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(item)
+        return merged
+    
+    def provider_timings(self) -> dict:
+        with self._stats_lock:
+            return {name: {'calls': stats['calls'],
+                           'late': stats['late'],
+                           'avg_ms': 1000 * stats['total'] / stats['calls'],
+                           'max_ms': 1000 * stats['max']}
+                    for name, stats in self.provider_stats.items() if stats['calls']}
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
     
-    def search_apps(self, query: str) -> List[AppInfo]:
+    def search_apps(self, query: str, mode: str = '') -> List[AppInfo]:
         if not query.strip():
-            return self.model.apps_cache[:20]
+            return self.default_apps()
             
+        index = self.model.search_index
+        history = self.model.launch_history
+        now = time.time()
+        
+        # Só os candidatos que casaram com a consulta consultam o histórico.
+        def frecency_boost(app):
+            score = history.score(app.path, now)
+            return FRECENCY_WEIGHT * math.log2(1.0 + score) if score else 0
+        
+        folded = fold(query.strip())
+        candidates = None
+        with self._refinement_lock:
+            last = self._last_refinement
+            if last and last[0] is index and last[1] == mode and folded.startswith(last[2]):
+                candidates = last[3]
+                self.refinement_stats['incremental'] += 1
+            else:
+                self.refinement_stats['full'] += 1
+        
+        results, matches = index.search_with_matches(query, limit=15, boost=frecency_boost,
+                                                     candidates=candidates)
+        with self._refinement_lock:
+            self._last_refinement = (index, mode, folded, matches) if matches is not None else None
+        return results
+    
+    def default_apps(self, limit: int = 20) -> List[AppInfo]:
+        index = self.model.search_index
+        with self._refinement_lock:
+            if self._apps_by_path_index is not index:
+                self._apps_by_path = {app.path: app for app in index.items}
+                self._apps_by_path_index = index
+            apps_by_path = self._apps_by_path
+        
         results = []
-        query_lower = query.lower()
+        for path in self.model.launch_history.top(limit):
+            app = apps_by_path.get(path)
+            if app:
+                results.append(app)
         
-        for app in self.model.apps_cache:
-            if query_lower in app.name.lower():
+        for app in index.items:
+            if len(results) >= limit:
+                break
+            if app not in results:
                 results.append(app)
                 
-        return sorted(results, key=lambda x: x.name.lower())[:15]
+        return results
+    
+    def search_files(self, query: str, token=None, publish=None, limit: int = FILE_RESULTS) -> List[Union[FileInfo, FolderInfo]]:
+        if not query.strip():
+            return []
+        
+        top = []
+        last_publish = None
+        for match in self.model.iter_file_matches(query.strip(), limit, token):
+            top.append(match)
+            top.sort(key=rank_key)
+            del top[limit:]
+            
+            now = time.perf_counter()
+            if publish and (last_publish is None or now - last_publish >= PUBLISH_INTERVAL):
+                publish([self.model.file_result(m) for m in top])
+                last_publish = now
+            
+        return [self.model.file_result(m) for m in top]
     
-    def search_files(self, query: str) -> List[Union[FileInfo, FolderInfo]]:
+    def search_content(self, query: str, token=None) -> List[FileInfo]:
         if not query.strip():
             return []
             
-        return self.model.search_files(query.strip(), max_results=8)  # Limitar ainda mais
+        return self.model.search_content(query.strip(), max_results=FILE_RESULTS, token=token)
     
     def search_web(self, query: str) -> List[WebInfo]:
         if not query.strip():
@@ -61,6 +226,7 @@ class SearchController:
     def execute_item(self, item: Union[AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo, FolderInfo]):
         try:
             if isinstance(item, AppInfo):
+                self.model.launch_history.record(item.path)
                 self.launch_app(item.path)
             elif isinstance(item, FileInfo):
                 self.open_file(item.path)
@@ -70,7 +236,7 @@ class SearchController:
                 self.open_website(item.url)
             elif isinstance(item, CommandInfo):
                 self.execute_command(item.command)
-            elif isinstance(item, MathInfo):
+            elif isinstance(item, MathInfo) and not (item.too_large or item.timed_out):
                 self.copy_to_clipboard(item.result)
         except Exception as e:
             print(f"Erro ao executar item: {e}")
@@ -0,0 +1,92 @@
+from typing import List, Optional
+
+class SearchProvider:
+    name = ""
+    prefix: Optional[str] = None
+    fan_out = False
+    budget = 0.05
+    priority = 0
+    min_length = 1
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    def accepts(self, query: str) -> bool:
+        return len(query.strip()) >= self.min_length
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        raise NotImplementedError
+
+class MathProvider(SearchProvider):
+    name = "math"
+    fan_out = True
+    budget = 0.01
+    priority = 100
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        result = self.controller.model.evaluate_math(query)
+        return [result] if result else []
+
+class AppProvider(SearchProvider):
+    name = "apps"
+    prefix = "."
+    fan_out = True
+    budget = 0.03
+    priority = 90
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        mode = self.prefix if query.startswith(self.prefix) else ''
+        return self.controller.search_apps(query[len(mode):], mode=mode)
+
+    def accepts(self, query: str) -> bool:
+        return True
+
+class FileProvider(SearchProvider):
+    name = "files"
+    prefix = "?"
+    fan_out = True
+    budget = 0.05
+    priority = 50
+    min_length = 3
+    fan_out_results = 3
+
+    def accepts(self, query: str) -> bool:
+        # Sem o índice pronto a busca varreria o disco a cada tecla; no fan-out
+        # os arquivos só entram depois da primeira indexação.
+        return super().accepts(query) and self.controller.model.file_index.ready.is_set()
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        if query.startswith(self.prefix):
+            return self.controller.search_files(query[1:], token, publish)
+        return self.controller.search_files(query, token, limit=self.fan_out_results)
+
+class ContentProvider(SearchProvider):
+    name = "content"
+    prefix = "??"
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        return self.controller.search_content(query[2:], token)
+
+class WebProvider(SearchProvider):
+    name = "web"
+    prefix = "/"
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        return self.controller.search_web(query[1:])
+
+class CommandProvider(SearchProvider):
+    name = "commands"
+    prefix = "!"
+
+    def search(self, query: str, token=None, publish=None) -> list:
+        return self.controller.create_command(query[1:])
+
+def default_providers(controller) -> List[SearchProvider]:
+    return [
+        MathProvider(controller),
+        AppProvider(controller),
+        FileProvider(controller),
+        ContentProvider(controller),
+        WebProvider(controller),
+        CommandProvider(controller),
+    ]
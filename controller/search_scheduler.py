@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from model.cancellation import CancellationToken
+from model.tracing import get_tracer
+
+class SearchScheduler(QObject):
+    results_ready = pyqtSignal(str, list)
+    _delivered = pyqtSignal(int, str, list)
+
+    def __init__(self, controller, debounce_ms: int = 30, max_workers: int = 4):
+        super().__init__()
+        self.controller = controller
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+        self.generation = 0
+        self.stale_results = 0
+        self._pending_query = ""
+        self._token = None
+        self.tracer = get_tracer()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._delivered.connect(self._on_delivered)
+
+    def schedule(self, query: str):
+        self.generation += 1
+        self._pending_query = query
+        if self._token:
+            self._token.cancel()
+            self._token = None
+
+        if query:
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self._dispatch()
+
+    def _dispatch(self):
+        generation = self.generation
+        query = self._pending_query
+        token = CancellationToken()
+        self._token = token
+        self.executor.submit(self._run, generation, query, token)
+
+    def _run(self, generation: int, query: str, token: CancellationToken):
+        if token.cancelled:
+            return
+        def publish(partial_results):
+            if not token.cancelled:
+                self._delivered.emit(generation, query, partial_results)
+
+        try:
+            results = self.controller.search(query, token, publish)
+        except Exception as e:
+            print(f"[SearchScheduler] Erro na busca '{query}': {e}")
+            results = []
+        if not token.cancelled:
+            self._delivered.emit(generation, query, results)
+
+    def _on_delivered(self, generation: int, query: str, results: list):
+        if generation != self.generation:
+            self.stale_results += 1
+            return
+        with self.tracer.span("deliver", query_length=len(query), count=len(results)):
+            self.results_ready.emit(query, results)
+
+    def shutdown(self):
+        self._timer.stop()
+        if self._token:
+            self._token.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -2,14 +2,15 @@ import sys
 import signal
 import atexit
 import os
+import time
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
-from PyQt6.QtCore import QTimer, QObject, pyqtSlot
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QIcon, QAction
 from view.topbar_view import TopBar
 from controller.main_controller import MainController
-from model.launcher_model import AppModel
-from controller.search_controller import SearchController
-from view.launcher_view import LauncherView
+from apps.launcher import RiwingLauncher
+from model.storage import get_data_dir
+from model.tracing import get_tracer
 
 os.environ["PYTHONIOENCODING"] = "utf-8"
 
@@ -48,6 +49,10 @@ class SystemTrayManager:
         about_action.triggered.connect(self.show_about)
         menu.addAction(about_action)
         
+        trace_action = QAction("Exportar trace de latência", menu)
+        trace_action.triggered.connect(self.dump_trace)
+        menu.addAction(trace_action)
+        
         menu.addSeparator()
         
         quit_action = QAction("Sair", menu)
@@ -57,7 +62,22 @@ class SystemTrayManager:
         self.tray_icon.setContextMenu(menu)
         self.tray_icon.setToolTip("Riwing")
         
-        print("Menu do system tray criado com 2 opções")
+        print("Menu do system tray criado com 3 opções")
+    
+    def dump_trace(self):
+        tracer = get_tracer()
+        if not tracer.enabled:
+            print("Tracing desativado. Inicie com RIWING_TRACE=1 ou --trace")
+            return
+        
+        path = os.path.join(get_data_dir(), f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        try:
+            count = tracer.dump(path)
+            print(f"Trace salvo em {path} ({count} eventos)")
+            self.tray_icon.showMessage("Riwing", f"Trace salvo em {path}",
+                                       QSystemTrayIcon.MessageIcon.Information, 3000)
+        except OSError as e:
+            print(f"Erro ao salvar trace {path}: {e}")
     
     def show_about(self):
         print("Função 'Sobre' chamada!")
@@ -72,32 +92,14 @@ class SystemTrayManager:
         
         msg.exec()
 
-class RiwingLauncher(QObject):
-    def __init__(self):
-        super().__init__()
-        
-        self.model = AppModel()
-        self.controller = SearchController(self.model)
-        self.view = LauncherView()
-        
-        self.view.search_requested.connect(self.on_search_requested)
-        self.view.item_executed.connect(self.controller.execute_item)
-        
-        self.model.load_installed_apps()
-   
-    @pyqtSlot(str)
-    def on_search_requested(self, query: str):
-        results = self.controller.search(query)
-        self.view.update_results(results)
-   
-    def cleanup(self):
-        self.model.cleanup()
-
 class App:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)  
         
+        if "--trace" in sys.argv:
+            get_tracer().enable()
+        
         if not QSystemTrayIcon.isSystemTrayAvailable():
             QMessageBox.critical(None, "System Tray", 
                                "System tray não está disponível neste sistema.")
@@ -105,7 +107,10 @@ class App:
         
         self.topbar = TopBar()
         self.controller = MainController(self.topbar)
-        self.launcher = RiwingLauncher()
+        self.launcher = RiwingLauncher(
+            startup_timing="--startup-timing" in sys.argv,
+            cold_start="--cold-start" in sys.argv
+        )
         
         self.tray_manager = SystemTrayManager(self)
         
@@ -0,0 +1,66 @@
+import os
+import json
+from typing import Dict, List, Optional, Tuple
+from model.storage import get_data_dir
+
+SNAPSHOT_VERSION = 1
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+        return (stat.st_size, stat.st_mtime_ns)
+    except (OSError, ValueError):
+        return None
+
+class AppCatalogSnapshot:
+    def __init__(self, path: str = None):
+        self.path = path or os.path.join(get_data_dir(), "app_catalog.json")
+        self._by_source: Dict[str, dict] = {}
+
+    def load(self) -> Optional[List[dict]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        entries = data.get("apps") or []
+        self._by_source = {}
+
+        for entry in entries:
+            source = entry.get("source")
+            if source:
+                self._by_source[source] = entry
+
+        return entries
+
+    def save(self, apps) -> bool:
+        entries = []
+        for app in apps:
+            entries.append({
+                "name": app.name,
+                "path": app.path,
+                "icon_path": app.icon_path,
+                "source": app.source,
+                "stamp": app.stamp,
+            })
+
+        data = {"version": SNAPSHOT_VERSION, "apps": entries}
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"Erro ao salvar snapshot do catálogo: {e}")
+            return False
+
+    def lookup(self, source: str, stamp) -> Optional[dict]:
+        entry = self._by_source.get(source)
+        if entry and stamp is not None and entry.get("stamp") == stamp:
+            return entry
+        return None
@@ -0,0 +1,265 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+from model.search_index import fold
+from model.storage import get_data_dir
+
+TOKEN_PATTERN = re.compile(r'\w{2,32}')
+BATCH_DOCS = 200
+BATCH_POSTINGS = 200000
+DEFAULT_EXTENSIONS = [
+    ".txt", ".md", ".rst", ".csv", ".log", ".ini", ".cfg", ".conf", ".json", ".xml",
+    ".yaml", ".yml", ".html", ".htm", ".css", ".js", ".ts", ".py", ".java", ".c",
+    ".cpp", ".h", ".cs", ".go", ".rs", ".sql", ".sh", ".bat", ".ps1",
+]
+
+def encode_postings(doc_ids: Iterable[int]) -> bytes:
+    out = bytearray()
+    previous = 0
+    for doc_id in sorted(doc_ids):
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+def decode_postings(blob: bytes) -> List[int]:
+    doc_ids = []
+    value = 0
+    shift = 0
+    previous = 0
+    for byte in blob:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += value
+        doc_ids.append(previous)
+        value = 0
+        shift = 0
+    return doc_ids
+
+def tokenize(text: str) -> Set[str]:
+    return set(TOKEN_PATTERN.findall(fold(text)))
+
+class ContentIndex:
+    def __init__(self, roots: List[str], max_depth: int = 3, path: str = None,
+                 extensions: List[str] = None, max_file_size: int = 1024 * 1024,
+                 interval: float = 300.0):
+        self.roots = [os.path.abspath(os.path.expanduser(root)) for root in roots]
+        self.max_depth = max_depth
+        self.path = path or os.path.join(get_data_dir(), "content_index.sqlite3")
+        self.extensions = {ext.lower() for ext in (extensions or DEFAULT_EXTENSIONS)}
+        self.max_file_size = max_file_size
+        self.interval = interval
+        self.ready = threading.Event()
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._thread = None
+        self._create_schema()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS docs ("
+                         "id INTEGER PRIMARY KEY AUTOINCREMENT, path TEXT UNIQUE NOT NULL, "
+                         "mtime INTEGER NOT NULL, size INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS terms ("
+                         "term TEXT PRIMARY KEY, postings BLOB NOT NULL) WITHOUT ROWID")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        if conn.execute("SELECT 1 FROM docs LIMIT 1").fetchone():
+            self.ready.set()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="ContentIndex", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.update()
+                self.ready.set()
+            except Exception as e:
+                print(f"[ContentIndex] Erro: {e}")
+            self._stop.wait(self.interval)
+
+    def _iter_files(self):
+        for root in self.roots:
+            pending = [(root, 0)]
+            while pending and not self._stop.is_set():
+                dir_path, depth = pending.pop()
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if depth < self.max_depth:
+                                        pending.append((entry.path, depth + 1))
+                                    continue
+                                if os.path.splitext(entry.name)[1].lower() not in self.extensions:
+                                    continue
+                                stat = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+                            if stat.st_size <= self.max_file_size:
+                                yield entry.path, stat.st_mtime_ns, stat.st_size
+                except OSError:
+                    continue
+
+    def _read_terms(self, path: str) -> Optional[Set[str]]:
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                return tokenize(f.read(self.max_file_size))
+        except OSError:
+            return None
+
+    def update(self):
+        conn = self._connection()
+        known = {path: (doc_id, mtime) for doc_id, path, mtime in
+                 conn.execute("SELECT id, path, mtime FROM docs")}
+        seen = set()
+        pending: Dict[str, List[int]] = {}
+        pending_docs = 0
+        pending_postings = 0
+
+        # As linhas de docs ficam na mesma transação das postagens do lote e só
+        # são gravadas juntas em _flush; uma queda no meio não deixa documento
+        # registrado sem postagens.
+        try:
+            for path, mtime, size in self._iter_files():
+                seen.add(path)
+                current = known.get(path)
+                if current and current[1] == mtime:
+                    continue
+
+                terms = self._read_terms(path)
+                if terms is None:
+                    continue
+
+                # Documento alterado ganha um id novo; o antigo some de docs e suas
+                # postagens viram lixo filtrado na consulta até a próxima compactação.
+                if current:
+                    conn.execute("DELETE FROM docs WHERE id = ?", (current[0],))
+                    self._add_dead(conn, 1)
+                doc_id = conn.execute("INSERT INTO docs (path, mtime, size) VALUES (?, ?, ?)",
+                                      (path, mtime, size)).lastrowid
+
+                for term in terms:
+                    pending.setdefault(term, []).append(doc_id)
+                pending_docs += 1
+                pending_postings += len(terms)
+                if pending_docs >= BATCH_DOCS or pending_postings >= BATCH_POSTINGS:
+                    self._flush(conn, pending)
+                    pending = {}
+                    pending_docs = pending_postings = 0
+
+                if self._stop.is_set():
+                    break
+
+            self._flush(conn, pending)
+        except BaseException:
+            conn.rollback()
+            raise
+
+        if not self._stop.is_set():
+            removed = [(doc_id,) for path, (doc_id, _) in known.items() if path not in seen]
+            if removed:
+                with conn:
+                    conn.executemany("DELETE FROM docs WHERE id = ?", removed)
+                    self._add_dead(conn, len(removed))
+            self.compact_if_needed(conn)
+
+    def _flush(self, conn: sqlite3.Connection, pending: Dict[str, List[int]]):
+        with conn:
+            for term, doc_ids in pending.items():
+                row = conn.execute("SELECT postings FROM terms WHERE term = ?", (term,)).fetchone()
+                if row:
+                    doc_ids = set(decode_postings(row[0])).union(doc_ids)
+                conn.execute("INSERT OR REPLACE INTO terms (term, postings) VALUES (?, ?)",
+                             (term, encode_postings(doc_ids)))
+
+    def _add_dead(self, conn: sqlite3.Connection, count: int):
+        conn.execute("INSERT INTO meta (key, value) VALUES ('dead', ?) "
+                     "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value", (count,))
+
+    def compact_if_needed(self, conn: sqlite3.Connection, dead_ratio: float = 0.3):
+        live = conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+        row = conn.execute("SELECT value FROM meta WHERE key = 'dead'").fetchone()
+        dead = row[0] if row else 0
+        if dead == 0 or dead < live * dead_ratio:
+            return
+
+        live_ids = {row[0] for row in conn.execute("SELECT id FROM docs")}
+        with conn:
+            for term, blob in conn.execute("SELECT term, postings FROM terms").fetchall():
+                doc_ids = [doc_id for doc_id in decode_postings(blob) if doc_id in live_ids]
+                if doc_ids:
+                    conn.execute("UPDATE terms SET postings = ? WHERE term = ?",
+                                 (encode_postings(doc_ids), term))
+                else:
+                    conn.execute("DELETE FROM terms WHERE term = ?", (term,))
+            conn.execute("UPDATE meta SET value = 0 WHERE key = 'dead'")
+        conn.execute("VACUUM")
+
+    def _postings(self, conn: sqlite3.Connection, term: str, prefix: bool, token=None) -> Set[int]:
+        if not prefix:
+            row = conn.execute("SELECT postings FROM terms WHERE term = ?", (term,)).fetchone()
+            return set(decode_postings(row[0])) if row else set()
+
+        doc_ids = set()
+        rows = conn.execute("SELECT postings FROM terms WHERE term >= ? AND term < ?",
+                            (term, term + "\U0010ffff"))
+        for (blob,) in rows:
+            if token is not None and token.cancelled:
+                break
+            doc_ids.update(decode_postings(blob))
+        return doc_ids
+
+    def search(self, query: str, max_results: int = 10, token=None) -> List[tuple]:
+        terms = TOKEN_PATTERN.findall(fold(query))
+        if not terms:
+            return []
+
+        conn = self._connection()
+        doc_ids = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            if token is not None and token.cancelled:
+                return []
+            # O último termo digitado ainda pode estar incompleto.
+            postings = self._postings(conn, term, prefix=(term == terms[-1]), token=token)
+            if token is not None and token.cancelled:
+                return []
+            doc_ids = postings if doc_ids is None else doc_ids & postings
+            if not doc_ids:
+                return []
+
+        ids = json.dumps(sorted(doc_ids))
+        rows = conn.execute("SELECT path, size FROM docs WHERE id IN (SELECT value FROM json_each(?)) "
+                            "ORDER BY mtime DESC LIMIT ?", (ids, max_results)).fetchall()
+        return [(os.path.basename(path), path, size) for path, size in rows]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
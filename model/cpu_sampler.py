@@ -0,0 +1,103 @@
+import time
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+MIN_INTERVAL = 0.25
+HISTORY_SIZE = 60
+
+class CpuReading:
+    __slots__ = ("percent", "per_core", "timestamp")
+
+    def __init__(self, percent: float, per_core: Tuple[float, ...], timestamp: float):
+        self.percent = percent
+        self.per_core = per_core
+        self.timestamp = timestamp
+
+def _split_times(times) -> Tuple[float, float]:
+    # Mesma conta do psutil.cpu_percent: iowait conta como ocioso no Linux, e
+    # guest/guest_nice já estão somados em user/nice, então saem do total.
+    total = sum(times) - getattr(times, "guest", 0.0) - getattr(times, "guest_nice", 0.0)
+    idle = times.idle + getattr(times, "iowait", 0.0)
+    return total, idle
+
+def _busy_percent(previous: Tuple[float, float], current: Tuple[float, float]) -> Optional[float]:
+    total = current[0] - previous[0]
+    idle = current[1] - previous[1]
+    if total < 0 or idle < 0:
+        return None
+    if total == 0:
+        return 0.0
+    return max(0.0, min(100.0, (total - idle) / total * 100.0))
+
+class CpuSampler:
+    # Diferença entre leituras de cpu_times: ao contrário de cpu_percent(interval=...),
+    # nenhuma leitura dorme. Chamadas mais próximas que min_interval devolvem a
+    # última leitura, já que intervalos curtos dão porcentagens ruidosas.
+    def __init__(self, min_interval: float = MIN_INTERVAL, history: int = HISTORY_SIZE):
+        self.min_interval = min_interval
+        self.history = deque(maxlen=history)
+        self._lock = threading.Lock()
+        # Base zerada: a primeira leitura é a média desde o boot, e não 0%.
+        self._core_count = psutil.cpu_count() or 1
+        self._previous_total = (0.0, 0.0)
+        self._previous_cores: List[Tuple[float, float]] = [(0.0, 0.0)] * self._core_count
+        self._latest: Optional[CpuReading] = None
+
+    def sample(self) -> CpuReading:
+        now = time.monotonic()
+        with self._lock:
+            if self._latest is not None and now - self._latest.timestamp < self.min_interval:
+                return self._latest
+
+            total = _split_times(psutil.cpu_times())
+            cores = [_split_times(times) for times in psutil.cpu_times(percpu=True)]
+            if len(cores) != len(self._previous_cores):
+                # CPU adicionada ou removida: recomeça a base dos núcleos.
+                self._core_count = len(cores)
+                self._previous_cores = [(0.0, 0.0)] * len(cores)
+
+            percent = _busy_percent(self._previous_total, total)
+            per_core = tuple(_busy_percent(previous, current) for previous, current
+                             in zip(self._previous_cores, cores))
+            if percent is None and self._latest is not None:
+                percent = self._latest.percent
+            per_core = tuple(0.0 if value is None else value for value in per_core)
+
+            self._previous_total = total
+            self._previous_cores = cores
+            self._latest = CpuReading(percent or 0.0, per_core, now)
+            self.history.append(self._latest)
+            return self._latest
+
+    def latest(self) -> CpuReading:
+        # Última leitura sem consultar os contadores, exceto na primeira vez.
+        return self._latest or self.sample()
+
+    def percent(self) -> float:
+        return self.sample().percent
+
+    def per_core(self) -> Tuple[float, ...]:
+        return self.sample().per_core
+
+    def core_history(self, core: int) -> List[float]:
+        with self._lock:
+            return [reading.per_core[core] for reading in self.history if core < len(reading.per_core)]
+
+    @property
+    def core_count(self) -> int:
+        return self._core_count
+
+# Um sampler por consumidor: cada um guarda a própria base e histórico, então
+# as diferenças e a história cobrem sempre o intervalo de quem consulta.
+_samplers: Dict[str, CpuSampler] = {}
+_samplers_lock = threading.Lock()
+
+def get_cpu_sampler(consumer: str = "default") -> CpuSampler:
+    with _samplers_lock:
+        sampler = _samplers.get(consumer)
+        if sampler is None:
+            sampler = _samplers[consumer] = CpuSampler()
+        return sampler
@@ -0,0 +1,231 @@
+import os
+import heapq
+import threading
+from array import array
+from typing import Dict, Iterator, List, Optional, Set
+from model.file_search import FileMatch, match_score
+from model.file_watcher import PollingWatcher, create_watcher
+from model.search_index import fold
+
+class DirRecord:
+    # Entradas em colunas (struct-of-arrays): sem tupla nem dict por arquivo,
+    # e o nome normalizado é calculado uma vez, na varredura do diretório.
+    __slots__ = ("depth", "mtime", "names", "folded", "is_dirs", "sizes")
+
+    def __init__(self, depth: int, mtime: int):
+        self.depth = depth
+        self.mtime = mtime
+        self.names: List[str] = []
+        self.folded: List[str] = []
+        self.is_dirs = bytearray()
+        self.sizes = array('q')
+
+    def add(self, name: str, is_dir: bool, size: int):
+        folded = fold(name)
+        self.names.append(name)
+        self.folded.append(name if folded == name else folded)
+        self.is_dirs.append(is_dir)
+        self.sizes.append(size)
+
+    def subdirs(self) -> Set[str]:
+        return {name for name, is_dir in zip(self.names, self.is_dirs) if is_dir}
+
+    def __len__(self):
+        return len(self.names)
+
+class FlatIndex:
+    __slots__ = ("names", "folded", "parents", "dir_paths", "is_dirs", "sizes")
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.folded: List[str] = []
+        self.parents = array('I')
+        self.dir_paths: List[str] = []
+        self.is_dirs = bytearray()
+        self.sizes = array('q')
+
+    def path(self, i: int) -> str:
+        return os.path.join(self.dir_paths[self.parents[i]], self.names[i])
+
+    def __len__(self):
+        return len(self.names)
+
+class FileIndex:
+    def __init__(self, roots: List[str], max_depth: int = 3, poll_interval: float = 5.0):
+        self.roots = [os.path.abspath(os.path.expanduser(root)) for root in roots]
+        self.max_depth = max_depth
+        self.poll_interval = poll_interval
+        self.ready = threading.Event()
+        self.generation = 0
+        self._dirs: Dict[str, DirRecord] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._flat = None
+        self.watcher = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="FileIndex", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if isinstance(self.watcher, PollingWatcher):
+            self.watcher.close()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _run(self):
+        self.watcher = create_watcher(self.poll_interval)
+        try:
+            self.rebuild()
+            self.ready.set()
+            while not self._stop.is_set():
+                changed = self.watcher.wait(timeout=1.0)
+                if self.watcher.overflowed:
+                    self.watcher.overflowed = False
+                    self.rebuild()
+                elif changed:
+                    for path in sorted(changed, key=len):
+                        self.rescan(path)
+        except Exception as e:
+            print(f"[FileIndex] Erro: {e}")
+        finally:
+            self.watcher.close()
+
+    def _watch(self, path: str, mtime: int):
+        try:
+            self.watcher.watch(path, mtime)
+        except OSError as e:
+            print(f"Falha ao observar {path}, usando polling: {e}")
+            old_watcher = self.watcher
+            self.watcher = PollingWatcher(self.poll_interval)
+            with self._lock:
+                dirs = [(dir_path, record.mtime) for dir_path, record in self._dirs.items()]
+            for dir_path, dir_mtime in dirs:
+                self.watcher.watch(dir_path, dir_mtime)
+            self.watcher.watch(path, mtime)
+            old_watcher.close()
+
+    def _scan_tree(self, path: str, depth: int, dirs: Dict[str, DirRecord]):
+        pending = [(path, depth)]
+        while pending and not self._stop.is_set():
+            dir_path, dir_depth = pending.pop()
+            record = self._scan_dir(dir_path, dir_depth)
+            if record is None:
+                continue
+            dirs[dir_path] = record
+            if dir_depth < self.max_depth:
+                for name in record.subdirs():
+                    pending.append((os.path.join(dir_path, name), dir_depth + 1))
+
+    def _scan_dir(self, path: str, depth: int) -> Optional[DirRecord]:
+        try:
+            record = DirRecord(depth, os.stat(path).st_mtime_ns)
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        size = 0 if is_dir else entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    record.add(entry.name, is_dir, size)
+        except OSError:
+            return None
+        return record
+
+    def rebuild(self):
+        dirs = {}
+        for root in self.roots:
+            if os.path.isdir(root):
+                self._scan_tree(root, 0, dirs)
+
+        with self._lock:
+            old_dirs = set(self._dirs)
+            self._dirs = dirs
+            self._flat = None
+            self.generation += 1
+
+        for path in old_dirs - set(dirs):
+            self.watcher.unwatch(path)
+        for path, record in dirs.items():
+            if path not in old_dirs:
+                self._watch(path, record.mtime)
+
+    def rescan(self, path: str):
+        with self._lock:
+            old = self._dirs.get(path)
+        if old is None:
+            return
+
+        record = self._scan_dir(path, old.depth)
+        removed = []
+        added = {}
+
+        with self._lock:
+            if record is None:
+                removed = [p for p in self._dirs if p == path or p.startswith(path + os.sep)]
+            else:
+                self._dirs[path] = record
+                for name in old.subdirs() - record.subdirs():
+                    sub_path = os.path.join(path, name)
+                    removed.extend(p for p in self._dirs
+                                   if p == sub_path or p.startswith(sub_path + os.sep))
+            for p in removed:
+                self._dirs.pop(p, None)
+            self._flat = None
+            self.generation += 1
+
+        if record is not None and old.depth < self.max_depth:
+            for name in record.subdirs() - old.subdirs():
+                self._scan_tree(os.path.join(path, name), old.depth + 1, added)
+
+        if added:
+            with self._lock:
+                self._dirs.update(added)
+                self._flat = None
+                self.generation += 1
+
+        for p in removed:
+            self.watcher.unwatch(p)
+        for p, sub_record in added.items():
+            self._watch(p, sub_record.mtime)
+
+    def _flatten(self) -> FlatIndex:
+        with self._lock:
+            flat = self._flat
+            if flat is not None:
+                return flat
+            flat = FlatIndex()
+            for dir_path, record in self._dirs.items():
+                flat.parents.extend(array('I', [len(flat.dir_paths)]) * len(record))
+                flat.dir_paths.append(dir_path)
+                flat.names.extend(record.names)
+                flat.folded.extend(record.folded)
+                flat.is_dirs.extend(record.is_dirs)
+                flat.sizes.extend(record.sizes)
+            self._flat = flat
+            return flat
+
+    def __len__(self):
+        return len(self._flatten())
+
+    def iter_search(self, query: str, max_results: int = 10, token=None) -> Iterator[FileMatch]:
+        query = fold(query.strip())
+        if not query:
+            return
+
+        flat = self._flatten()
+        names = flat.names
+        # Mesma ordem de rank_key; o caminho completo só é montado para os escolhidos.
+        ranked = [(-match_score(query, name), len(names[i]), name, i)
+                  for i, name in enumerate(flat.folded) if query in name]
+        if token is not None and token.cancelled:
+            return
+        for negative_score, _, name, i in heapq.nsmallest(max_results, ranked):
+            yield FileMatch(-negative_score, names[i], flat.path(i), bool(flat.is_dirs[i]),
+                            flat.sizes[i], name)
+
+    def search(self, query: str, max_results: int = 10) -> List[FileMatch]:
+        return list(self.iter_search(query, max_results))
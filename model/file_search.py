@@ -0,0 +1,68 @@
+import os
+from collections import namedtuple
+from typing import Iterator, List, Optional
+from model.search_index import fold
+
+SCORE_PREFIX = 2
+SCORE_WORD = 1
+SCORE_SUBSTRING = 0
+
+FileMatch = namedtuple("FileMatch", ["score", "name", "path", "is_dir", "size", "folded"])
+
+def match_score(query: str, folded: str) -> Optional[int]:
+    position = folded.find(query)
+    if position < 0:
+        return None
+    if position == 0:
+        return SCORE_PREFIX
+    while position > 0:
+        if not folded[position - 1].isalnum():
+            return SCORE_WORD
+        position = folded.find(query, position + 1)
+    return SCORE_SUBSTRING
+
+def rank_key(match: FileMatch):
+    return (-match.score, len(match.name), match.folded)
+
+def crawl_matches(query: str, roots: List[str], max_depth: int, token=None,
+                  max_results: int = 10, good_score: int = SCORE_PREFIX) -> Iterator[FileMatch]:
+    query = fold(query.strip())
+    if not query:
+        return
+
+    level = [root for root in roots if os.path.isdir(root)]
+    good_matches = 0
+    for depth in range(max_depth + 1):
+        next_level = []
+        for dir_path in level:
+            if token is not None and token.cancelled:
+                return
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if is_dir and depth < max_depth:
+                            next_level.append(entry.path)
+
+                        folded = fold(entry.name)
+                        score = match_score(query, folded)
+                        if score is None:
+                            continue
+                        try:
+                            size = 0 if is_dir else entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+
+                        yield FileMatch(score, entry.name, entry.path, is_dir, size, folded)
+                        # Resultados rasos e bons o bastante encerram a varredura
+                        # sem descer nos níveis mais profundos.
+                        if score >= good_score:
+                            good_matches += 1
+                            if good_matches >= max_results:
+                                return
+            except OSError:
+                continue
+        level = next_level
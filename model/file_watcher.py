@@ -0,0 +1,169 @@
+import os
+import sys
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+import threading
+from typing import Dict, Set
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+EVENT_HEADER = struct.Struct("iIII")
+
+class PollingWatcher:
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._dirs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._next_poll = time.monotonic() + interval
+        self.overflowed = False
+
+    def watch(self, path: str, mtime: int = None):
+        if mtime is None:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return
+        with self._lock:
+            self._dirs[path] = mtime
+
+    def unwatch(self, path: str):
+        with self._lock:
+            self._dirs.pop(path, None)
+
+    def wait(self, timeout: float = None) -> Set[str]:
+        # O timeout só define quanto tempo esperar por um pedido de parada; os
+        # diretórios são consultados no máximo uma vez por intervalo.
+        remaining = self._next_poll - time.monotonic()
+        if timeout is not None and timeout < remaining:
+            self._stop.wait(timeout)
+            return set()
+        if self._stop.wait(max(0.0, remaining)):
+            return set()
+        self._next_poll = time.monotonic() + self.interval
+
+        with self._lock:
+            dirs = list(self._dirs.items())
+
+        changed = set()
+        for path, mtime in dirs:
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                changed.add(path)
+                with self._lock:
+                    if current is None:
+                        self._dirs.pop(path, None)
+                    elif path in self._dirs:
+                        self._dirs[path] = current
+        return changed
+
+    def close(self):
+        self._stop.set()
+
+class InotifyWatcher:
+    def __init__(self, settle: float = 0.2):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falhou")
+
+        self.settle = settle
+        self.overflowed = False
+        self._wd_to_path: Dict[int, str] = {}
+        self._path_to_wd: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def watch(self, path: str, mtime: int = None):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch falhou para {path}")
+        with self._lock:
+            self._wd_to_path[wd] = path
+            self._path_to_wd[path] = wd
+
+    def unwatch(self, path: str):
+        with self._lock:
+            wd = self._path_to_wd.pop(path, None)
+            if wd is None:
+                return
+            self._wd_to_path.pop(wd, None)
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _read_events(self, changed: Set[str]):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            with self._lock:
+                path = self._wd_to_path.get(wd)
+                if mask & IN_IGNORED and path is not None:
+                    self._wd_to_path.pop(wd, None)
+                    self._path_to_wd.pop(path, None)
+            if path is not None:
+                changed.add(path)
+
+    def wait(self, timeout: float = None) -> Set[str]:
+        changed = set()
+        if self._closed:
+            return changed
+        try:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+        except (OSError, ValueError):
+            return changed
+        if not readable:
+            return changed
+
+        self._read_events(changed)
+        # Agrupa rajadas (ex.: cópia de muitos arquivos) numa única reindexação.
+        deadline = time.monotonic() + self.settle
+        while not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if readable:
+                self._read_events(changed)
+        return changed
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            os.close(self._fd)
+
+def create_watcher(poll_interval: float = 5.0):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            print(f"inotify indisponível, usando polling: {e}")
+    return PollingWatcher(poll_interval)
@@ -0,0 +1,218 @@
+import os
+import time
+import signal
+import base64
+import queue
+import platform
+import itertools
+import threading
+import subprocess
+import uuid
+from typing import List, Optional, Tuple
+
+DEFAULT_TIMEOUT = 5.0
+PING_TIMEOUT = 2.0
+
+class HelperProcessError(Exception):
+    pass
+
+class HelperProcessTimeout(HelperProcessError):
+    pass
+
+class ShellDialect:
+    def __init__(self, argv: List[str], init: str = ""):
+        self.argv = argv
+        self.init = init
+
+    def frame(self, command: str, marker: str) -> str:
+        raise NotImplementedError
+
+    def ping_command(self) -> str:
+        raise NotImplementedError
+
+class PosixShell(ShellDialect):
+    def __init__(self, argv: List[str] = None):
+        super().__init__(argv or ["/bin/sh"])
+
+    def frame(self, command: str, marker: str) -> str:
+        # O printf começa com \n para o marcador sair em linha própria mesmo
+        # quando a saída do comando não termina com quebra de linha.
+        return f"{command}\nprintf '\\n%s %d\\n' '{marker}' $?\n"
+
+    def ping_command(self) -> str:
+        return "echo ok"
+
+class PowerShell(ShellDialect):
+    def __init__(self):
+        super().__init__(["powershell", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass",
+                          "-WindowStyle", "Hidden", "-Command", "-"],
+                         init="[Console]::OutputEncoding = [Text.Encoding]::UTF8")
+
+    def frame(self, command: str, marker: str) -> str:
+        # Com "-Command -" o PowerShell lê linha a linha; o script vai numa
+        # linha só, em base64, para blocos multilinha chegarem inteiros.
+        encoded = base64.b64encode(command.encode("utf-8")).decode("ascii")
+        return (f"Invoke-Expression ([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{encoded}')))\n"
+                f"[Console]::Out.WriteLine(\"`n{marker} $(if ($?) {{0}} else {{1}})\")\n")
+
+    def ping_command(self) -> str:
+        return "Write-Output ok"
+
+def default_dialect() -> ShellDialect:
+    return PowerShell() if platform.system() == "Windows" else PosixShell()
+
+class HelperProcessSession:
+    def __init__(self, dialect: ShellDialect = None, timeout: float = DEFAULT_TIMEOUT):
+        self.dialect = dialect or default_dialect()
+        self.timeout = timeout
+        self.restarts = 0
+        self.calls = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+        self._lock = threading.Lock()
+        self._session_id = uuid.uuid4().hex
+        self._sequence = itertools.count()
+
+    def _start(self):
+        startupinfo = None
+        creationflags = 0
+        posix = platform.system() != "Windows"
+        if not posix:
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+            creationflags = subprocess.CREATE_NO_WINDOW
+
+        try:
+            self._process = subprocess.Popen(self.dialect.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                             stderr=subprocess.DEVNULL, text=True, encoding="utf-8",
+                                             errors="replace", bufsize=1, startupinfo=startupinfo,
+                                             creationflags=creationflags, start_new_session=posix)
+        except OSError as e:
+            raise HelperProcessError(f"falha ao iniciar {self.dialect.argv[0]}: {e}")
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_stdout, args=(self._process, self._lines),
+                         name="HelperProcessReader", daemon=True).start()
+        if self.dialect.init:
+            self._call_locked(self.dialect.init, self.timeout)
+
+    def _read_stdout(self, process: subprocess.Popen, lines: queue.Queue):
+        try:
+            for line in process.stdout:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                process.stdout.close()
+            except OSError:
+                pass
+        lines.put(None)
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _kill(self):
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+        try:
+            # Filhos do shell (ex.: um sleep) herdam o stdout; mata o grupo todo
+            # para o pipe fechar e a thread leitora terminar.
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+            process.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        # O stdout é fechado pela thread leitora; fechá-lo aqui bloquearia
+        # enquanto ela ainda estiver lendo.
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+
+    def restart(self):
+        with self._lock:
+            self._kill()
+            self.restarts += 1
+            try:
+                self._start()
+            except HelperProcessError:
+                self._kill()
+                raise
+
+    def call(self, command: str, timeout: float = None, retries: int = 0) -> Tuple[int, str]:
+        # Um processo morto é recriado antes do comando. Em qualquer falha,
+        # inclusive no init de um processo novo, ele é descartado: o estado e
+        # as linhas ainda não lidas são desconhecidos. retries só deve ser
+        # usado com comandos idempotentes, já que o comando pode ter rodado
+        # antes de o processo cair.
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            for attempt in range(retries + 1):
+                try:
+                    if not self.is_alive():
+                        if self._process is not None:
+                            self.restarts += 1
+                        self._kill()
+                        self._start()
+                    return self._call_locked(command, timeout)
+                except HelperProcessTimeout:
+                    self._kill()
+                    raise
+                except HelperProcessError:
+                    self._kill()
+                    if attempt == retries:
+                        raise
+
+    def _call_locked(self, command: str, timeout: float) -> Tuple[int, str]:
+        self.calls += 1
+        marker = f"__riwing_{self._session_id}_{next(self._sequence)}__"
+        try:
+            self._process.stdin.write(self.dialect.frame(command, marker))
+            self._process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise HelperProcessError(f"falha ao escrever no processo auxiliar: {e}")
+
+        output = []
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HelperProcessTimeout(f"sem resposta em {timeout:.1f}s")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise HelperProcessTimeout(f"sem resposta em {timeout:.1f}s")
+            if line is None:
+                raise HelperProcessError("processo auxiliar terminou")
+            if line.startswith(marker):
+                status = line[len(marker):].strip()
+                # Remove a quebra de linha extra que antecede o marcador.
+                text = "".join(output)
+                if text.endswith("\n"):
+                    text = text[:-1]
+                return (int(status) if status.lstrip("-").isdigit() else 0), text
+            output.append(line)
+
+    def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        try:
+            status, output = self.call(self.dialect.ping_command(), timeout=timeout, retries=0)
+        except HelperProcessError:
+            return False
+        return status == 0 and output.strip() == "ok"
+
+    def close(self):
+        with self._lock:
+            process = self._process
+            if process is not None and process.poll() is None:
+                try:
+                    process.stdin.write("exit\n")
+                    process.stdin.flush()
+                    process.wait(timeout=1.0)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    pass
+            self._kill()
@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+from model.app_catalog import file_signature
+from model.storage import get_data_dir
+
+INDEX_VERSION = 1
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+ORPHAN_GRACE = 2.0
+
+def resolve_source(exe_path: str) -> str:
+    if not os.path.isabs(exe_path) and os.environ.get("WINDIR"):
+        system_path = os.path.join(os.environ["WINDIR"], "System32", exe_path)
+        if os.path.exists(system_path):
+            return system_path
+    return exe_path
+
+class IconCache:
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or get_data_dir("icons")
+        self.index_path = os.path.join(self.directory, "index.json")
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load_index()
+
+    def make_key(self, exe_path: str) -> str:
+        source = resolve_source(exe_path)
+        size, mtime = file_signature(source) or (0, 0)
+        raw = f"{os.path.normcase(source)}|{size}|{mtime}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+
+        entries = sorted(data.get("entries", {}).items(), key=lambda kv: kv[1].get("used", 0))
+        with self._lock:
+            for key, entry in entries:
+                self._entries[key] = entry
+                self.total_bytes += entry.get("bytes", 0)
+
+    def save_index(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": INDEX_VERSION, "entries": dict(self._entries)}
+            self._dirty = False
+
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Erro ao salvar índice de ícones: {e}")
+
+    def get(self, exe_path: str) -> Optional[str]:
+        key = self.make_key(exe_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            entry["used"] = time.time()
+            self._dirty = True
+
+        icon_path = self.path_for(key)
+        if os.path.exists(icon_path):
+            return icon_path
+
+        self._remove(key)
+        return None
+
+    def put(self, exe_path: str, image) -> Optional[str]:
+        key = self.make_key(exe_path)
+        icon_path = self.path_for(key)
+        try:
+            image.save(icon_path, format="PNG")
+            size = os.path.getsize(icon_path)
+        except OSError as e:
+            print(f"Erro ao salvar ícone em cache: {e}")
+            return None
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self.total_bytes -= old.get("bytes", 0)
+            self._entries[key] = {"source": resolve_source(exe_path), "bytes": size, "used": time.time()}
+            self.total_bytes += size
+            self._dirty = True
+
+        self.evict()
+        return icon_path
+
+    def evict(self):
+        removed = []
+        with self._lock:
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                key, entry = self._entries.popitem(last=False)
+                self.total_bytes -= entry.get("bytes", 0)
+                removed.append(key)
+            if removed:
+                self._dirty = True
+
+        for key in removed:
+            try:
+                os.remove(self.path_for(key))
+            except OSError:
+                pass
+
+    def _remove(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self.total_bytes -= entry.get("bytes", 0)
+                self._dirty = True
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    def compact(self):
+        started = time.time()
+        with self._lock:
+            entries = list(self._entries.items())
+
+        for key, entry in entries:
+            source = entry.get("source")
+            if not os.path.exists(self.path_for(key)) or (
+                    source and os.path.isabs(source) and self.make_key(source) != key):
+                self._remove(key)
+
+        with self._lock:
+            known = set(self._entries)
+        try:
+            for name in os.listdir(self.directory):
+                stem, ext = os.path.splitext(name)
+                if ext != ".png" or stem in known:
+                    continue
+                # put() grava o arquivo antes de registrá-lo no índice; um PNG
+                # recente pode ser de um put() em andamento, não um órfão.
+                path = os.path.join(self.directory, name)
+                try:
+                    if os.path.getmtime(path) < started - ORPHAN_GRACE:
+                        os.remove(path)
+                except OSError:
+                    pass
+        except OSError as e:
+            print(f"Erro ao compactar cache de ícones: {e}")
+
+        self.evict()
+        self.save_index()
@@ -0,0 +1,109 @@
+import os
+import json
+import math
+import time
+import threading
+from typing import List, Optional
+from model.storage import get_data_dir
+
+HISTORY_VERSION = 1
+DEFAULT_HALF_LIFE = 7 * 24 * 3600
+DEFAULT_FLUSH_INTERVAL = 5.0
+# Entradas abaixo desse score (uma execução há ~7 meias-vidas) são descartadas.
+MIN_SCORE = 0.01
+MAX_ENTRIES = 500
+
+class LaunchHistory:
+    def __init__(self, path: str = None, half_life: float = DEFAULT_HALF_LIFE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = path or os.path.join(get_data_dir(), "launch_history.json")
+        self.half_life = half_life
+        self.flush_interval = flush_interval
+        self._entries = {}
+        self._ranking: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._stop = threading.Event()
+        self.load()
+
+        self._thread = threading.Thread(target=self._flush_loop, name="LaunchHistoryFlush", daemon=True)
+        self._thread.start()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == HISTORY_VERSION:
+            with self._lock:
+                self._entries = {key: tuple(value) for key, value in data.get("entries", {}).items()}
+                self._ranking = None
+
+    def _decayed(self, entry, now: float) -> float:
+        score, timestamp = entry
+        return score * math.pow(2.0, (timestamp - now) / self.half_life)
+
+    def record(self, key: str, now: Optional[float] = None):
+        now = now or time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            score = self._decayed(entry, now) if entry else 0.0
+            self._entries[key] = (score + 1.0, now)
+            self._ranking = None
+            self._dirty = True
+
+    def score(self, key: str, now: Optional[float] = None) -> float:
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        return self._decayed(entry, now or time.time())
+
+    def _ranked(self, now: float) -> List[str]:
+        # Todas as entradas decaem pelo mesmo fator, então a ordem só muda
+        # quando record() altera alguma; chamar com o lock adquirido.
+        if self._ranking is None:
+            self._ranking = sorted(self._entries, key=lambda key: self._decayed(self._entries[key], now),
+                                   reverse=True)
+        return self._ranking
+
+    def top(self, limit: int, now: Optional[float] = None) -> List[str]:
+        now = now or time.time()
+        with self._lock:
+            return self._ranked(now)[:limit]
+
+    def _prune(self, now: float):
+        ranking = self._ranked(now)
+        keep = [key for key in ranking[:MAX_ENTRIES] if self._decayed(self._entries[key], now) >= MIN_SCORE]
+        if len(keep) < len(ranking):
+            self._entries = {key: self._entries[key] for key in keep}
+            self._ranking = keep
+            self._dirty = True
+
+    def flush(self):
+        with self._lock:
+            self._prune(time.time())
+            if not self._dirty:
+                return
+            data = {"version": HISTORY_VERSION, "entries": dict(self._entries)}
+            self._dirty = False
+
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Erro ao salvar histórico de execuções: {e}")
+            with self._lock:
+                self._dirty = True
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self.flush()
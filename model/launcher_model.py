@@ -1,123 +1,246 @@
 import os
-import winreg
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional, Union
-import win32ui
-import win32gui
-import win32con
-import win32api
-from PIL import Image
-import tempfile
-import math
-import re
+import heapq
+from typing import Iterator, List, Dict, Optional, Union
+import threading
+try:
+    import winreg
+    import win32ui
+    import win32gui
+    import win32con
+    import win32api
+    from PIL import Image
+except ImportError:
+    # Fora do Windows (benchmarks headless) só a parte de busca do modelo é usada.
+    winreg = win32ui = win32gui = win32con = win32api = Image = None
+from model.app_catalog import AppCatalogSnapshot
+from model.icon_cache import IconCache
+from model.search_index import SearchIndex, fold
+from model.launch_history import LaunchHistory
+from model.file_index import FileIndex
+from model.content_index import ContentIndex
+from model.file_search import FileMatch, crawl_matches, rank_key
+from model.settings import get_setting
+from model.math_evaluator import MathEvaluator, MathTooLarge, MathTimeout
 
 class AppInfo:
-    def __init__(self, name: str, path: str, icon_path: str = None):
+    __slots__ = ("name", "path", "icon_path", "source", "stamp", "_folded")
+    type = "app"
+
+    def __init__(self, name: str, path: str, icon_path: str = None, source: str = None, stamp=None):
         self.name = name
         self.path = path
         self.icon_path = icon_path
-        self.type = "app"
+        self.source = source
+        self.stamp = stamp
+        self._folded = None
+
+    @property
+    def folded(self) -> str:
+        # Calculado uma vez por registro; o mesmo AppInfo atravessa vários
+        # índices durante o carregamento em streaming do catálogo.
+        if self._folded is None:
+            self._folded = fold(self.name)
+        return self._folded
 
 class FileInfo:
+    __slots__ = ("name", "path", "size")
+    type = "file"
+
     def __init__(self, name: str, path: str, size: int = 0):
         self.name = name
         self.path = path
         self.size = size
-        self.type = "file"
 
 class WebInfo:
+    __slots__ = ("name", "url")
+    type = "web"
+
     def __init__(self, name: str, url: str):
         self.name = name
         self.url = url
-        self.type = "web"
 
 class CommandInfo:
+    __slots__ = ("name", "command")
+    type = "command"
+
     def __init__(self, name: str, command: str):
         self.name = name
         self.command = command
-        self.type = "command"
 
 class MathInfo:
-    def __init__(self, expression: str, result: str):
+    __slots__ = ("expression", "result", "too_large", "timed_out", "name")
+    type = "math"
+
+    def __init__(self, expression: str, result: str, too_large: bool = False, timed_out: bool = False):
         self.expression = expression
         self.result = result
+        self.too_large = too_large
+        self.timed_out = timed_out
         self.name = f"{expression} = {result}"
-        self.type = "math"
 
 class FolderInfo:
+    __slots__ = ("name", "path")
+    type = "folder"
+
     def __init__(self, name: str, path: str):
         self.name = name
         self.path = path
-        self.type = "folder"
+
+def app_folded(app: AppInfo) -> str:
+    return app.folded
+
+SYSTEM_APPS = [
+    {"name": "Calculadora", "path": "calc.exe"},
+    {"name": "Bloco de Notas", "path": "notepad.exe"},
+    {"name": "Paint", "path": "mspaint.exe"},
+    {"name": "Explorador de Arquivos", "path": "explorer.exe"},
+    {"name": "Prompt de Comando", "path": "cmd.exe"},
+    {"name": "PowerShell", "path": "powershell.exe"},
+    {"name": "Painel de Controle", "path": "control.exe"},
+    {"name": "Gerenciador de Tarefas", "path": "taskmgr.exe"},
+    {"name": "Configurações", "path": "ms-settings:"},
+]
+
+REGISTRY_PATHS = [
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+    (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+] if winreg else []
+
+START_MENU_PATHS = [
+    r"C:\ProgramData\Microsoft\Windows\Start Menu\Programs",
+    os.path.expanduser(r"~\AppData\Roaming\Microsoft\Windows\Start Menu\Programs")
+]
 
 class AppModel:
     def __init__(self):
         self.apps_cache: List[AppInfo] = []
+        self.search_index = SearchIndex(self.apps_cache, folded_key=app_folded)
+        self.catalog_generation = 0
         self.icon_cache: Dict[str, str] = {}
-        self.temp_dir = tempfile.mkdtemp()
-        
+        self.icon_store = IconCache()
+        self.snapshot = AppCatalogSnapshot()
+        self.launch_history = LaunchHistory()
+        self.file_index = FileIndex(get_setting("file_search", "roots"),
+                                    max_depth=get_setting("file_search", "depth"),
+                                    poll_interval=get_setting("file_search", "poll_interval"))
+        self.content_index = None
+        if get_setting("content_search", "enabled"):
+            self.content_index = ContentIndex(get_setting("file_search", "roots"),
+                                              max_depth=get_setting("file_search", "depth"),
+                                              extensions=get_setting("content_search", "extensions"),
+                                              max_file_size=get_setting("content_search", "max_file_size"),
+                                              interval=get_setting("content_search", "interval"))
+        self.math_evaluator = MathEvaluator()
+        self._catalog_lock = threading.Lock()
+
+    def publish_apps(self, apps: List[AppInfo], search_index: Optional[SearchIndex] = None):
+        # O worker do catálogo já entrega o índice pronto, fora da thread da interface.
+        if search_index is None:
+            search_index = SearchIndex(apps, folded_key=app_folded)
+        with self._catalog_lock:
+            self.apps_cache = apps
+            self.search_index = search_index
+            self.catalog_generation += 1
+
+    def load_cached_apps(self) -> bool:
+        entries = self.snapshot.load()
+        if not entries:
+            return False
+
+        apps = []
+        for entry in entries:
+            icon_path = entry.get("icon_path")
+            if icon_path and not os.path.exists(icon_path):
+                icon_path = None
+            apps.append(AppInfo(entry["name"], entry["path"], icon_path,
+                                entry.get("source"), entry.get("stamp")))
+
+        self.publish_apps(apps)
+        return True
+
+    def save_snapshot(self) -> bool:
+        return self.snapshot.save(self.apps_cache)
+
     def load_installed_apps(self):
-        self.apps_cache = []
-        
-        system_apps = [
-            {"name": "Calculadora", "path": "calc.exe"},
-            {"name": "Bloco de Notas", "path": "notepad.exe"},
-            {"name": "Paint", "path": "mspaint.exe"},
-            {"name": "Explorador de Arquivos", "path": "explorer.exe"},
-            {"name": "Prompt de Comando", "path": "cmd.exe"},
-            {"name": "PowerShell", "path": "powershell.exe"},
-            {"name": "Painel de Controle", "path": "control.exe"},
-            {"name": "Gerenciador de Tarefas", "path": "taskmgr.exe"},
-            {"name": "Configurações", "path": "ms-settings:"},
-        ]
-        
-        for app in system_apps:
-            icon_path = self.extract_icon(app["path"])
-            app_info = AppInfo(app["name"], app["path"], icon_path)
-            self.apps_cache.append(app_info)
-        
-        registry_paths = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-        ]
+        self.publish_apps(self.discover_apps())
+
+    def discover_apps(self) -> List[AppInfo]:
+        apps = self.get_system_apps()
         
-        for hkey, subkey_path in registry_paths:
-            try:
-                with winreg.OpenKey(hkey, subkey_path) as key:
-                    i = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, i)
-                            with winreg.OpenKey(key, subkey_name) as app_key:
-                                app_info = self.get_app_info(app_key)
-                                if app_info:
-                                    self.apps_cache.append(app_info)
-                            i += 1
-                        except WindowsError:
-                            break
-            except Exception as e:
-                print(f"Erro ao acessar registry {subkey_path}: {e}")
-                continue
+        for hkey, subkey_path in REGISTRY_PATHS:
+            apps.extend(self.scan_registry_path(hkey, subkey_path))
         
-        self.load_start_menu_apps()
+        for start_path in START_MENU_PATHS:
+            for shortcut_path in self.find_shortcuts(start_path):
+                app_info = self.resolve_cached_shortcut(shortcut_path)
+                if app_info:
+                    apps.append(app_info)
         
+        return self.deduplicate_apps(apps)
+
+    def deduplicate_apps(self, apps: List[AppInfo]) -> List[AppInfo]:
         seen_paths = set()
         unique_apps = []
-        for app in self.apps_cache:
+        for app in apps:
             real_path = os.path.realpath(app.path).lower()
             if real_path not in seen_paths and os.path.exists(app.path):
                 seen_paths.add(real_path)
                 unique_apps.append(app)
         
-        self.apps_cache = sorted(unique_apps, key=lambda x: x.name.lower())
+        return sorted(unique_apps, key=lambda x: x.folded)
+
+    def get_system_apps(self) -> List[AppInfo]:
+        apps = []
+        for app in SYSTEM_APPS:
+            apps.append(AppInfo(app["name"], app["path"], self.cached_icon(app["path"])))
+        return apps
+
+    def scan_registry_path(self, hkey, subkey_path: str) -> List[AppInfo]:
+        apps = []
+        try:
+            with winreg.OpenKey(hkey, subkey_path) as key:
+                i = 0
+                while True:
+                    try:
+                        subkey_name = winreg.EnumKey(key, i)
+                        with winreg.OpenKey(key, subkey_name) as app_key:
+                            source = f"{hkey}\\{subkey_path}\\{subkey_name}"
+                            stamp = winreg.QueryInfoKey(app_key)[2]
+                            cached = self.snapshot.lookup(source, stamp)
+                            if cached:
+                                app_info = AppInfo(cached["name"], cached["path"],
+                                                   self.cached_icon(cached["path"]),
+                                                   source, stamp)
+                            else:
+                                app_info = self.get_app_info(app_key)
+                                if app_info:
+                                    app_info.source = source
+                                    app_info.stamp = stamp
+                            if app_info:
+                                apps.append(app_info)
+                        i += 1
+                    except WindowsError:
+                        break
+        except Exception as e:
+            print(f"Erro ao acessar registry {subkey_path}: {e}")
+        return apps
     
-    def extract_icon(self, exe_path: str) -> Optional[str]:
+    def cached_icon(self, exe_path: str) -> Optional[str]:
         if exe_path in self.icon_cache:
             return self.icon_cache[exe_path]
         
-        icon_path = None
+        icon_path = self.icon_store.get(exe_path)
+        if icon_path:
+            self.icon_cache[exe_path] = icon_path
+        return icon_path
+
+    def extract_icon(self, exe_path: str) -> Optional[str]:
+        icon_path = self.cached_icon(exe_path)
+        if icon_path:
+            return icon_path
         
         try:
             icon_path = self._extract_with_shgetfileinfo(exe_path)
@@ -164,7 +287,7 @@ class AppModel:
             )
             
             if ret and shfileinfo.hIcon:
-                icon_path = self._hicon_to_image(shfileinfo.hIcon, exe_path, "shgetfileinfo")
+                icon_path = self._hicon_to_image(shfileinfo.hIcon, exe_path)
                 windll.user32.DestroyIcon(shfileinfo.hIcon)
                 return icon_path
                 
@@ -172,7 +295,8 @@ class AppModel:
             pass
         return None
 
-    def _extract_with_extracticon(self, exe_path: str) -> Optional[str]:
+    def _extract_with_extracticon(self, exe_path: str, cache_key: str = None) -> Optional[str]:
+        cache_key = cache_key or exe_path
         try:
             if exe_path in ['calc.exe', 'notepad.exe', 'mspaint.exe']:
                 sys_path = os.path.join(os.environ['WINDIR'], 'System32', exe_path)
@@ -183,7 +307,7 @@ class AppModel:
                 try:
                     large, small = win32gui.ExtractIconEx(exe_path, icon_index)
                     if large:
-                        icon_path = self._hicon_to_image(large[0], exe_path, f"extracticon_{icon_index}")
+                        icon_path = self._hicon_to_image(large[0], cache_key)
                         
                         for icon in large:
                             if icon: win32gui.DestroyIcon(icon)
@@ -222,14 +346,14 @@ class AppModel:
                             icon_file = icon_info.strip('"')
                         
                         if os.path.exists(icon_file):
-                            return self._extract_with_extracticon(icon_file)
+                            return self._extract_with_extracticon(icon_file, exe_path)
                 except Exception:
                     pass
         except Exception:
             pass
         return None
 
-    def _hicon_to_image(self, hicon: int, exe_path: str, method: str) -> Optional[str]:
+    def _hicon_to_image(self, hicon: int, exe_path: str) -> Optional[str]:
         try:
             ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
             ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
@@ -246,11 +370,7 @@ class AppModel:
             bmpstr = hbmp.GetBitmapBits(True)
             img = Image.frombuffer('RGBA', (ico_x, ico_y), bmpstr, 'raw', 'BGRA', 0, 1)
             
-            icon_filename = f"icon_{hash(exe_path)}_{method}.png"
-            icon_path = os.path.join(self.temp_dir, icon_filename)
-            img.save(icon_path)
-            
-            return icon_path
+            return self.icon_store.put(exe_path, img)
             
         except Exception as e:
             print(f"Erro ao converter ícone: {e}")
@@ -301,34 +421,41 @@ class AppModel:
             if ',' in path:
                 path = path.split(',')[0].strip('"')
             
-            icon_path = self.extract_icon(path)
-            return AppInfo(name, path, icon_path)
+            return AppInfo(name, path, self.cached_icon(path))
             
         except Exception:
             return None
     
-    def load_start_menu_apps(self):
-        start_menu_paths = [
-            r"C:\ProgramData\Microsoft\Windows\Start Menu\Programs",
-            os.path.expanduser(r"~\AppData\Roaming\Microsoft\Windows\Start Menu\Programs")
-        ]
-        
-        for start_path in start_menu_paths:
-            if os.path.exists(start_path):
-                self.scan_directory_for_shortcuts(start_path)
-    
-    def scan_directory_for_shortcuts(self, directory):
+    def find_shortcuts(self, directory) -> List[str]:
+        shortcuts = []
+        if not os.path.exists(directory):
+            return shortcuts
         try:
             for root, dirs, files in os.walk(directory):
                 for file in files:
                     if file.endswith('.lnk'):
-                        shortcut_path = os.path.join(root, file)
-                        app_info = self.resolve_shortcut(shortcut_path)
-                        if app_info:
-                            self.apps_cache.append(app_info)
+                        shortcuts.append(os.path.join(root, file))
         except Exception as e:
             print(f"Erro ao escanear {directory}: {e}")
+        return shortcuts
     
+    def resolve_cached_shortcut(self, shortcut_path) -> Optional[AppInfo]:
+        try:
+            stamp = os.stat(shortcut_path).st_mtime_ns
+        except OSError:
+            stamp = None
+
+        cached = self.snapshot.lookup(shortcut_path, stamp)
+        if cached:
+            return AppInfo(cached["name"], cached["path"], self.cached_icon(cached["path"]),
+                           shortcut_path, stamp)
+
+        app_info = self.resolve_shortcut(shortcut_path)
+        if app_info:
+            app_info.source = shortcut_path
+            app_info.stamp = stamp
+        return app_info
+
     def resolve_shortcut(self, shortcut_path) -> Optional[AppInfo]:
         try:
             import win32com.client
@@ -339,8 +466,7 @@ class AppModel:
             name = os.path.splitext(os.path.basename(shortcut_path))[0]
             
             if target_path and target_path.endswith('.exe') and os.path.exists(target_path):
-                icon_path = self.extract_icon(target_path)
-                return AppInfo(name, target_path, icon_path)
+                return AppInfo(name, target_path, self.cached_icon(target_path))
                 
         except Exception:
             name = os.path.splitext(os.path.basename(shortcut_path))[0]
@@ -348,62 +474,27 @@ class AppModel:
             
         return None
     
-    def search_files(self, query: str, max_results: int = 10) -> List[Union[FileInfo, 'FolderInfo']]:
-        results = []
-        search_paths = [
-            os.path.expanduser("~/Documents"),
-            os.path.expanduser("~/Desktop"),
-            os.path.expanduser("~/Downloads"),
-        ]
-        
-        for search_path in search_paths:
-            if len(results) >= max_results:
-                break
-                
-            try:
-                for item in os.listdir(search_path):
-                    if len(results) >= max_results:
-                        break
-                        
-                    if query.lower() in item.lower():
-                        full_path = os.path.join(search_path, item)
-                        try:
-                            if os.path.isdir(full_path):
-                                results.append(FolderInfo(item, full_path))
-                            else:
-                                size = os.path.getsize(full_path)
-                                results.append(FileInfo(item, full_path, size))
-                        except:
-                            continue
-                
-                for subdir in os.listdir(search_path):
-                    if len(results) >= max_results:
-                        break
-                        
-                    subdir_path = os.path.join(search_path, subdir)
-                    if os.path.isdir(subdir_path):
-                        try:
-                            for item in os.listdir(subdir_path):
-                                if len(results) >= max_results:
-                                    break
-                                    
-                                if query.lower() in item.lower():
-                                    full_path = os.path.join(subdir_path, item)
-                                    try:
-                                        if os.path.isdir(full_path):
-                                            results.append(FolderInfo(item, full_path))
-                                        else:
-                                            size = os.path.getsize(full_path)
-                                            results.append(FileInfo(item, full_path, size))
-                                    except:
-                                        continue
-                        except:
-                            continue
-                            
-            except PermissionError:
-                continue
-                
-        return results
+    def iter_file_matches(self, query: str, max_results: int = 10, token=None) -> Iterator[FileMatch]:
+        if self.file_index.ready.is_set():
+            return self.file_index.iter_search(query, max_results, token)
+        return crawl_matches(query, self.file_index.roots, self.file_index.max_depth,
+                             token, max_results)
+
+    def file_result(self, match: FileMatch) -> Union[FileInfo, 'FolderInfo']:
+        if match.is_dir:
+            return FolderInfo(match.name, match.path)
+        return FileInfo(match.name, match.path, match.size)
+
+    def search_files(self, query: str, max_results: int = 10, token=None) -> List[Union[FileInfo, 'FolderInfo']]:
+        matches = heapq.nsmallest(max_results, self.iter_file_matches(query, max_results, token),
+                                  key=rank_key)
+        return [self.file_result(match) for match in matches]
+    
+    def search_content(self, query: str, max_results: int = 10, token=None) -> List[FileInfo]:
+        if not self.content_index or not self.content_index.ready.is_set():
+            return []
+        return [FileInfo(name, path, size)
+                for name, path, size in self.content_index.search(query, max_results, token)]
     
     def get_web_suggestions(self, query: str) -> List[WebInfo]:
         popular_sites = [
@@ -417,84 +508,23 @@ class AppModel:
         return [WebInfo(name, url) for name, url in popular_sites]
 
     def evaluate_math(self, expression: str) -> Optional[MathInfo]:
+        display = expression.strip().replace('^', '**')
         try:
-            expression = expression.strip()
-            allowed_functions = {
-                'sqrt', 'log', 'log10', 'log2', 'ln',
-                'sin', 'cos', 'tan', 'asin', 'acos', 'atan',
-                'sinh', 'cosh', 'tanh',
-                'exp', 'pow', 'abs', 'ceil', 'floor', 'round',
-                'degrees', 'radians'
-            }
-            allowed_chars = set('0123456789+-*/.()^, ')
-            temp_expr = expression.lower()
-            for func in allowed_functions:
-                temp_expr = temp_expr.replace(func, '')
-            
-            if not all(c in allowed_chars for c in temp_expr):
-                return None
-            
-            function_pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-            functions_found = re.findall(function_pattern, expression.lower())
-            
-            for func in functions_found:
-                if func not in allowed_functions:
-                    return None
-            
-            safe_dict = {
-                "__builtins__": {},
-                "sqrt": math.sqrt,
-                "log": math.log,
-                "log10": math.log10,
-                "log2": math.log2,
-                "ln": math.log,  
-                "exp": math.exp,
-                "pow": math.pow,
-                "abs": abs,
-                "round": round,
-                "sin": math.sin,
-                "cos": math.cos,
-                "tan": math.tan,
-                "asin": math.asin,
-                "acos": math.acos,
-                "atan": math.atan,
-                "sinh": math.sinh,
-                "cosh": math.cosh,
-                "tanh": math.tanh,
-                "ceil": math.ceil,
-                "floor": math.floor,
-                "degrees": math.degrees,
-                "radians": math.radians,
-                "pi": math.pi,
-                "e": math.e,
-            }
-            
-            expression = expression.replace('^', '**')
-            
-            result = eval(expression, safe_dict, {})
-            
-            if isinstance(result, float):
-                if result.is_integer():
-                    result_str = str(int(result))
-                else:
-                    result_str = f"{result:.10g}"
-            else:
-                result_str = str(result)
-            
-            return MathInfo(expression, result_str)
-            
-        except ZeroDivisionError:
-            return None  
-        except ValueError:
-            return None  
-        except OverflowError:
-            return None  
-        except:
+            result = self.math_evaluator.evaluate(expression)
+        except MathTooLarge:
+            return MathInfo(display, "muito grande", too_large=True)
+        except MathTimeout:
+            return MathInfo(display, "demorou demais", timed_out=True)
+        if result is None:
             return None
+        return MathInfo(display, result)
         
     def cleanup(self):
         try:
-            import shutil
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.file_index.stop()
+            if self.content_index:
+                self.content_index.stop()
+            self.launch_history.close()
+            self.icon_store.save_index()
         except:
             pass
\ No newline at end of file
@@ -0,0 +1,341 @@
+import os
+import re
+import sys
+import math
+import time
+import operator
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Optional
+
+MAX_EXPONENT = 10000
+# O risco real é converter o resultado em texto: acima do limite de dígitos
+# do Python str(int) falha, e multiplicações desse porte ainda são baratas.
+MAX_RESULT_DIGITS = getattr(sys, "get_int_max_str_digits", lambda: 0)() or 4300
+MAX_RESULT_BITS = int((MAX_RESULT_DIGITS - 1) / math.log10(2))
+MAX_OPERATIONS = 10000
+DEFAULT_TIMEOUT = 0.05
+MAX_DEPTH = 64
+
+class MathSyntaxError(ValueError):
+    pass
+
+class MathTooLarge(Exception):
+    pass
+
+class MathTimeout(Exception):
+    pass
+
+class Budget:
+    __slots__ = ("deadline", "operations")
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, max_operations: int = MAX_OPERATIONS):
+        self.deadline = time.perf_counter() + timeout
+        self.operations = max_operations
+
+    def charge(self):
+        self.operations -= 1
+        if self.operations < 0 or time.perf_counter() > self.deadline:
+            raise MathTimeout()
+
+def check_size(value):
+    if isinstance(value, int):
+        if value.bit_length() > MAX_RESULT_BITS:
+            raise MathTooLarge()
+    elif isinstance(value, float) and math.isinf(value):
+        raise MathTooLarge()
+    return value
+
+def _multiply(left, right):
+    # Estima o tamanho antes de multiplicar para não alocar inteiros gigantes.
+    if isinstance(left, int) and isinstance(right, int):
+        if left.bit_length() + right.bit_length() > MAX_RESULT_BITS + 1:
+            raise MathTooLarge()
+    return left * right
+
+def _power(base, exponent):
+    if abs(exponent) > MAX_EXPONENT:
+        raise MathTooLarge()
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+        if (base.bit_length() - 1) * exponent > MAX_RESULT_BITS:
+            raise MathTooLarge()
+    return base ** exponent
+
+def _round(value, ndigits=None):
+    if ndigits is not None and abs(ndigits) > MAX_EXPONENT:
+        raise MathTooLarge()
+    return round(value, ndigits)
+
+FUNCTIONS = {
+    "sqrt": math.sqrt,
+    "log": math.log,
+    "log10": math.log10,
+    "log2": math.log2,
+    "ln": math.log,
+    "exp": math.exp,
+    "pow": math.pow,
+    "abs": abs,
+    "round": _round,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "asin": math.asin,
+    "acos": math.acos,
+    "atan": math.atan,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    "ceil": math.ceil,
+    "floor": math.floor,
+    "degrees": math.degrees,
+    "radians": math.radians,
+}
+
+CONSTANTS = {
+    "pi": math.pi,
+    "e": math.e,
+}
+
+BINARY_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": _multiply,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+}
+
+SYMBOL_CHARS = frozenset("0123456789+-*/.()^, \t")
+NAME_PREFIXES = frozenset(name[:i] for name in list(FUNCTIONS) + list(CONSTANTS)
+                          for i in range(1, len(name) + 1))
+TOKEN_PATTERN = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([a-z_][a-z0-9_]*)|(\*\*|//|[-+*/^(),]))")
+# Símbolos que nunca se juntam ao texto seguinte num token maior.
+CLOSED_SYMBOLS = frozenset("()^,")
+
+def tokenize(expression: str, position: int = 0, tokens: list = None, ends: list = None):
+    tokens = [] if tokens is None else tokens
+    ends = [] if ends is None else ends
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if not match:
+            raise MathSyntaxError(expression)
+        tokens.append(match.groups())
+        position = match.end()
+        ends.append(position)
+    return tokens, ends
+
+def resume_point(tokens: list, ends: list, common: int) -> int:
+    # Quantos tokens da expressão anterior valem para a nova: só até uma
+    # fronteira que o texto seguinte não consegue estender ("2" vira "23",
+    # "*" vira "**", "2e+" vira "2e+5").
+    count = len(tokens)
+    while count and ends[count - 1] > common:
+        count -= 1
+    while count:
+        symbol = tokens[count - 1][2]
+        if symbol in CLOSED_SYMBOLS:
+            break
+        if symbol in ("+", "-") and (count < 2 or tokens[count - 2][1] != "e"):
+            break
+        count -= 1
+    return count
+
+def quick_reject(expression: str) -> bool:
+    # Uma passada só: qualquer caractere fora do alfabeto, ou sequência de
+    # letras que não seja prefixo de função/constante conhecida, descarta.
+    name = ""
+    has_digit = False
+    for c in expression:
+        if c in SYMBOL_CHARS:
+            if c.isdigit():
+                has_digit = True
+            name = ""
+        elif c.isalpha() or (name and c.isdigit()):
+            name += c
+            if name not in NAME_PREFIXES:
+                return True
+        else:
+            return True
+    return not has_digit and "(" not in expression
+
+class _Parser:
+    def __init__(self, tokens: list, groups: Optional[OrderedDict] = None, group_limit: int = 0):
+        self.tokens = tokens
+        self.index = 0
+        self.depth = 0
+        self.groups = groups
+        self.group_limit = group_limit
+        self.closing = {}
+        opened = []
+        for i, token in enumerate(tokens):
+            if token[2] == "(":
+                opened.append(i)
+            elif token[2] == ")" and opened:
+                self.closing[opened.pop()] = i
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else (None, None, None)
+
+    def next(self):
+        token = self.peek()
+        self.index += 1
+        return token
+
+    def expect(self, symbol: str):
+        if self.next()[2] != symbol:
+            raise MathSyntaxError(symbol)
+
+    def parse(self) -> Callable:
+        node = self.expression()
+        if self.index != len(self.tokens):
+            raise MathSyntaxError("tokens restantes")
+        return node
+
+    def expression(self) -> Callable:
+        node = self.term()
+        while self.peek()[2] in ("+", "-"):
+            node = self.binary(BINARY_OPERATORS[self.next()[2]], node, self.term())
+        return node
+
+    def term(self) -> Callable:
+        node = self.unary()
+        while self.peek()[2] in ("*", "/", "//"):
+            node = self.binary(BINARY_OPERATORS[self.next()[2]], node, self.unary())
+        return node
+
+    def unary(self) -> Callable:
+        # Todo aninhamento (parênteses, sinais, potências) passa por aqui.
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise MathSyntaxError("aninhamento")
+        try:
+            symbol = self.peek()[2]
+            if symbol == "-":
+                self.next()
+                operand = self.unary()
+                return lambda budget: -operand(budget)
+            if symbol == "+":
+                self.next()
+                return self.unary()
+            return self.power()
+        finally:
+            self.depth -= 1
+
+    def power(self) -> Callable:
+        base = self.atom()
+        if self.peek()[2] in ("^", "**"):
+            self.next()
+            return self.binary(_power, base, self.unary())
+        return base
+
+    def atom(self) -> Callable:
+        # Grupos entre parênteses e chamadas já compilados em teclas
+        # anteriores são reaproveitados pelos seus tokens.
+        start = self.index
+        if self.peek()[1] is not None and start + 1 < len(self.tokens) and self.tokens[start + 1][2] == "(":
+            end = self.closing.get(start + 1)
+        else:
+            end = self.closing.get(start)
+        if end is None or self.groups is None:
+            return self.group()
+
+        key = tuple(self.tokens[start:end + 1])
+        node = self.groups.get(key)
+        if node is not None:
+            self.groups.move_to_end(key)
+            self.index = end + 1
+            return node
+        node = self.group()
+        self.groups[key] = node
+        if len(self.groups) > self.group_limit:
+            self.groups.popitem(last=False)
+        return node
+
+    def group(self) -> Callable:
+        number, name, symbol = self.next()
+        if number is not None:
+            value = float(number) if any(c in number for c in ".eE") else int(number)
+            return lambda budget: value
+        if name is not None:
+            if self.peek()[2] == "(":
+                function = FUNCTIONS.get(name)
+                if function is None:
+                    raise MathSyntaxError(name)
+                self.next()
+                args = [] if self.peek()[2] == ")" else self.arguments()
+                self.expect(")")
+                return lambda budget: check_size(function(*[arg(budget) for arg in args]))
+            if name not in CONSTANTS:
+                raise MathSyntaxError(name)
+            value = CONSTANTS[name]
+            return lambda budget: value
+        if symbol == "(":
+            node = self.expression()
+            self.expect(")")
+            return node
+        raise MathSyntaxError(symbol)
+
+    def arguments(self) -> list:
+        args = [self.expression()]
+        while self.peek()[2] == ",":
+            self.next()
+            args.append(self.expression())
+        return args
+
+    def binary(self, function: Callable, left: Callable, right: Callable) -> Callable:
+        def node(budget):
+            left_value = left(budget)
+            right_value = right(budget)
+            budget.charge()
+            return check_size(function(left_value, right_value))
+        return node
+
+def format_result(result) -> str:
+    if isinstance(result, float):
+        if result.is_integer():
+            return str(int(result))
+        return f"{result:.10g}"
+    return str(result)
+
+class MathEvaluator:
+    def __init__(self, cache_size: int = 512):
+        self.compile = lru_cache(maxsize=cache_size)(self._compile)
+        self.cache_size = cache_size
+        self._groups = OrderedDict()
+        self._last = ("", [], [])
+        self._lock = threading.Lock()
+
+    def _tokenize(self, expression: str):
+        # Digitando, cada consulta estende a anterior; a tokenização retoma
+        # do ponto seguro em vez de recomeçar do início.
+        last_expression, last_tokens, last_ends = self._last
+        common = len(os.path.commonprefix([last_expression, expression]))
+        count = resume_point(last_tokens, last_ends, common)
+        tokens, ends = tokenize(expression, last_ends[count - 1] if count else 0,
+                                last_tokens[:count], last_ends[:count])
+        self._last = (expression, tokens, ends)
+        return tokens
+
+    def _compile(self, expression: str) -> Optional[Callable]:
+        with self._lock:
+            try:
+                tokens = self._tokenize(expression.rstrip())
+                return _Parser(tokens, self._groups, self.cache_size).parse()
+            except (MathSyntaxError, IndexError, RecursionError):
+                return None
+
+    def evaluate(self, expression: str, timeout: float = DEFAULT_TIMEOUT) -> Optional[str]:
+        expression = expression.strip().lower()
+        if not expression or quick_reject(expression):
+            return None
+
+        node = self.compile(expression)
+        if node is None:
+            return None
+
+        try:
+            return format_result(check_size(node(Budget(timeout))))
+        except OverflowError:
+            raise MathTooLarge()
+        except (ZeroDivisionError, ValueError, TypeError, RecursionError):
+            return None
@@ -0,0 +1,354 @@
+import re
+import platform
+import threading
+from typing import Callable, Dict, List, Optional
+
+try:
+    import jeepney
+except ImportError:
+    jeepney = None
+
+MediaInfo = Dict[str, str]
+
+TITLE_PATTERN = re.compile(r'^(.+?)\s*[-–—]\s*(.+?)$')
+IDLE_TITLES = {"", "Spotify", "Spotify Free", "Spotify Premium"}
+
+MPRIS_PREFIX = "org.mpris.MediaPlayer2."
+MPRIS_PATH = "/org/mpris/MediaPlayer2"
+MPRIS_PLAYER = "org.mpris.MediaPlayer2.Player"
+
+def parse_window_title(title: str, app: str = "Spotify") -> Optional[MediaInfo]:
+    title = (title or "").strip()
+    if title in IDLE_TITLES:
+        return None
+    match = TITLE_PATTERN.match(title)
+    if match:
+        return {'artist': match.group(1).strip(), 'title': match.group(2).strip(), 'app': app}
+    return {'artist': 'Unknown Artist', 'title': title, 'app': app}
+
+def parse_mpris_metadata(metadata: dict, app: str) -> Optional[MediaInfo]:
+    # Valores D-Bus chegam como (assinatura, valor), ex.: ('as', ['Artista']).
+    title = metadata.get('xesam:title', ('s', ''))[1]
+    if not title:
+        return None
+    artists = metadata.get('xesam:artist', ('as', []))[1]
+    artist = ", ".join(artists) if isinstance(artists, list) else str(artists)
+    return {'artist': artist or 'Unknown Artist', 'title': title, 'app': app}
+
+class MediaBackend:
+    name = "base"
+
+    def __init__(self):
+        self._callbacks: List[Callable[[Optional[MediaInfo]], None]] = []
+        self._current: Optional[MediaInfo] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback: Callable[[Optional[MediaInfo]], None]):
+        self._callbacks.append(callback)
+
+    def current(self) -> Optional[MediaInfo]:
+        with self._lock:
+            return self._current
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run_safe, name=f"Media-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _run_safe(self):
+        try:
+            self._run()
+        except Exception as e:
+            print(f"[MediaBackend:{self.name}] Erro: {e}")
+
+    def _run(self):
+        raise NotImplementedError
+
+    def _poll(self, probe: Callable[[], Optional[MediaInfo]], interval: float):
+        while not self._stop.is_set():
+            try:
+                self._publish(probe())
+            except Exception as e:
+                print(f"[MediaBackend:{self.name}] Erro: {e}")
+            self._stop.wait(interval)
+
+    def _publish(self, info: Optional[MediaInfo]):
+        with self._lock:
+            if info == self._current:
+                return
+            self._current = info
+        for callback in self._callbacks:
+            try:
+                callback(info)
+            except Exception as e:
+                print(f"[MediaBackend:{self.name}] Erro no assinante: {e}")
+
+class PollingBackend(MediaBackend):
+    name = "polling"
+
+    def __init__(self, probe: Callable[[], Optional[MediaInfo]], interval: float = 3.0):
+        super().__init__()
+        self.probe = probe
+        self.interval = interval
+
+    def _run(self):
+        self._poll(self.probe, self.interval)
+
+class WindowTitleBackend(MediaBackend):
+    name = "wineventhook"
+    PLAYER_PROCESSES = {"spotify.exe": "Spotify"}
+
+    EVENT_OBJECT_DESTROY = 0x8001
+    EVENT_OBJECT_NAMECHANGE = 0x800C
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WINEVENT_SKIPOWNPROCESS = 0x0002
+    OBJID_WINDOW = 0
+    WM_QUIT = 0x0012
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+    def __init__(self, fallback: Optional[Callable[[], Optional[MediaInfo]]] = None, interval: float = 3.0):
+        super().__init__()
+        self.fallback = fallback
+        self.interval = interval
+        self._thread_id = None
+        self._hwnd = None
+        self._process_apps: Dict[int, Optional[str]] = {}
+
+    def stop(self):
+        self._stop.set()
+        if self._thread_id:
+            import ctypes
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _run(self):
+        import ctypes
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        self._user32 = user32
+        self._kernel32 = kernel32
+
+        WinEventProc = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                          wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+                                           wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+
+        def on_event(hook, event, hwnd, id_object, id_child, thread, time_ms):
+            if id_object != self.OBJID_WINDOW or not hwnd:
+                return
+            if event == self.EVENT_OBJECT_DESTROY:
+                if hwnd == self._hwnd:
+                    self._hwnd = None
+                    self._publish(self._scan())
+                return
+            app = self._player_app(hwnd)
+            if app is None:
+                return
+            info = parse_window_title(self._window_title(hwnd), app)
+            if info:
+                self._hwnd = hwnd
+                self._publish(info)
+            elif hwnd == self._hwnd:
+                # Janela principal voltou ao título ocioso: música pausada.
+                self._publish(None)
+
+        callback = WinEventProc(on_event)
+        flags = self.WINEVENT_OUTOFCONTEXT | self.WINEVENT_SKIPOWNPROCESS
+        hooks = [user32.SetWinEventHook(event, event, 0, callback, 0, 0, flags)
+                 for event in (self.EVENT_OBJECT_NAMECHANGE, self.EVENT_OBJECT_DESTROY)]
+        self._thread_id = kernel32.GetCurrentThreadId()
+        if not any(hooks):
+            print(f"[MediaBackend:{self.name}] SetWinEventHook falhou, usando polling")
+            if self.fallback:
+                self._poll(self.fallback, self.interval)
+            return
+
+        try:
+            self._publish(self._scan())
+            msg = wintypes.MSG()
+            while not self._stop.is_set() and user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+
+    def _window_title(self, hwnd) -> str:
+        import ctypes
+        length = self._user32.GetWindowTextLengthW(hwnd)
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        self._user32.GetWindowTextW(hwnd, buffer, length + 1)
+        return buffer.value
+
+    def _player_app(self, hwnd) -> Optional[str]:
+        import ctypes
+        from ctypes import wintypes
+        pid = wintypes.DWORD()
+        self._user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        pid = pid.value
+        # Eventos de título chegam de todas as janelas do sistema; o nome do
+        # processo é consultado uma vez por pid.
+        if pid in self._process_apps:
+            return self._process_apps[pid]
+        if len(self._process_apps) > 512:
+            self._process_apps.clear()
+
+        app = None
+        handle = self._kernel32.OpenProcess(self.PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if handle:
+            try:
+                size = wintypes.DWORD(260)
+                buffer = ctypes.create_unicode_buffer(size.value)
+                if self._kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                    image = buffer.value.rsplit("\\", 1)[-1].lower()
+                    app = self.PLAYER_PROCESSES.get(image)
+            finally:
+                self._kernel32.CloseHandle(handle)
+        self._process_apps[pid] = app
+        return app
+
+    def _scan(self) -> Optional[MediaInfo]:
+        import ctypes
+        from ctypes import wintypes
+        found = []
+
+        def on_window(hwnd, _):
+            app = self._player_app(hwnd)
+            if app:
+                info = parse_window_title(self._window_title(hwnd), app)
+                if info:
+                    found.append((hwnd, info))
+                    return False
+            return True
+
+        EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+        self._user32.EnumWindows(EnumWindowsProc(on_window), 0)
+        if not found:
+            return None
+        self._hwnd, info = found[0]
+        return info
+
+class MprisBackend(MediaBackend):
+    name = "mpris"
+
+    # bus aceita "SESSION" ou o endereço de um barramento privado (testes).
+    def __init__(self, bus: str = "SESSION", fallback: Optional[Callable[[], Optional[MediaInfo]]] = None,
+                 interval: float = 3.0):
+        super().__init__()
+        self.bus = bus
+        self.fallback = fallback
+        self.interval = interval
+        self._players: Dict[str, dict] = {}
+
+    def _run(self):
+        try:
+            from jeepney import MatchRule
+            from jeepney.bus_messages import message_bus
+            from jeepney.io.blocking import open_dbus_connection
+            conn = open_dbus_connection(bus=self.bus)
+        except Exception as e:
+            # Sem barramento de sessão (ex.: sessão sem D-Bus) ainda há o polling.
+            print(f"[MediaBackend:{self.name}] D-Bus indisponível ({e!r}), usando polling")
+            if self.fallback:
+                self._poll(self.fallback, self.interval)
+            return
+
+        try:
+            properties_rule = MatchRule(type="signal", interface="org.freedesktop.DBus.Properties",
+                                        member="PropertiesChanged", path=MPRIS_PATH)
+            owner_rule = MatchRule(type="signal", sender="org.freedesktop.DBus", interface="org.freedesktop.DBus",
+                                   member="NameOwnerChanged", path="/org/freedesktop/DBus")
+            owner_rule.add_arg_condition(0, MPRIS_PREFIX.rstrip("."), kind="namespace")
+            conn.send_and_get_reply(message_bus.AddMatch(properties_rule))
+            conn.send_and_get_reply(message_bus.AddMatch(owner_rule))
+
+            with conn.filter(properties_rule, bufsize=64) as queue, \
+                    conn.filter(owner_rule, queue=queue):
+                self._refresh(conn)
+                while not self._stop.is_set():
+                    try:
+                        msg = conn.recv_until_filtered(queue, timeout=1.0)
+                    except TimeoutError:
+                        continue
+                    self._handle(conn, msg)
+        finally:
+            conn.close()
+
+    def _handle(self, conn, msg):
+        from jeepney import HeaderFields
+        if msg.header.fields.get(HeaderFields.member) == "NameOwnerChanged":
+            name, old_owner, new_owner = msg.body
+            self._players.pop(old_owner, None)
+            if new_owner:
+                self._load_player(conn, name, new_owner)
+        else:
+            interface, changed, _ = msg.body
+            if interface != MPRIS_PLAYER:
+                return
+            sender = msg.header.fields.get(HeaderFields.sender)
+            player = self._players.get(sender)
+            if player is None:
+                # Player que apareceu sem NameOwnerChanged visto: relê todos.
+                self._refresh(conn)
+                player = self._players.get(sender)
+                if player is None:
+                    return
+            if 'PlaybackStatus' in changed:
+                player['status'] = changed['PlaybackStatus'][1]
+            if 'Metadata' in changed:
+                player['metadata'] = changed['Metadata'][1]
+            self._players[sender] = self._players.pop(sender)
+        self._publish(self._active())
+
+    def _refresh(self, conn):
+        from jeepney.bus_messages import message_bus
+        names = conn.send_and_get_reply(message_bus.ListNames()).body[0]
+        for name in names:
+            if name.startswith(MPRIS_PREFIX):
+                try:
+                    owner = conn.send_and_get_reply(message_bus.GetNameOwner(name)).body[0]
+                except Exception:
+                    continue
+                self._load_player(conn, name, owner)
+        self._publish(self._active())
+
+    def _load_player(self, conn, name: str, owner: str):
+        from jeepney import DBusAddress, Properties
+        address = DBusAddress(MPRIS_PATH, bus_name=name, interface=MPRIS_PLAYER)
+        try:
+            values = conn.send_and_get_reply(Properties(address).get_all(), timeout=1.0).body[0]
+        except Exception as e:
+            print(f"[MediaBackend:{self.name}] Erro ao ler {name}: {e}")
+            return
+        self._players[owner] = {
+            'app': name[len(MPRIS_PREFIX):].split(".")[0].capitalize(),
+            'status': values.get('PlaybackStatus', ('s', 'Stopped'))[1],
+            'metadata': values.get('Metadata', ('a{sv}', {}))[1],
+        }
+
+    def _active(self) -> Optional[MediaInfo]:
+        # O player que mudou por último fica no fim do dict.
+        for player in reversed(list(self._players.values())):
+            if player['status'] == "Playing":
+                return parse_mpris_metadata(player['metadata'], player['app'])
+        return None
+
+def create_media_backend(probe: Callable[[], Optional[MediaInfo]]) -> MediaBackend:
+    system = platform.system()
+    if system == "Windows":
+        return WindowTitleBackend(fallback=probe)
+    if system == "Linux" and jeepney is not None:
+        return MprisBackend(fallback=probe)
+    return PollingBackend(probe)
@@ -1,8 +1,9 @@
-import subprocess
 import platform
 import re
 from typing import Optional, Dict
 import time
+from model.media_backends import MediaBackend, parse_window_title
+from model.helper_process import HelperProcessSession, HelperProcessTimeout, PowerShell
 
 class MediaDetector:
     def __init__(self):
@@ -10,8 +11,18 @@ class MediaDetector:
         self._last_track = None
         self._cache = {'data': None, 'timestamp': 0}
         self._cache_duration = 2 
+        self.backend: Optional[MediaBackend] = None
+        self._session: Optional[HelperProcessSession] = None
+        
+    def attach_backend(self, backend: MediaBackend):
+        self.backend = backend
         
     def get_current_media(self) -> Optional[Dict[str, str]]:
+        if self.backend is not None:
+            return self.backend.current()
+        return self.probe()
+        
+    def probe(self) -> Optional[Dict[str, str]]:
         current_time = time.time()
         if (self._cache['data'] is not None and 
             current_time - self._cache['timestamp'] < self._cache_duration):
@@ -25,6 +36,13 @@ class MediaDetector:
         self._cache['timestamp'] = current_time
         return result
     
+    def session(self) -> HelperProcessSession:
+        # Um único PowerShell fica vivo entre as consultas; criar um processo
+        # por consulta custava centenas de ms a cada troca de faixa.
+        if self._session is None:
+            self._session = HelperProcessSession(PowerShell())
+        return self._session
+    
     def _get_windows_media(self) -> Optional[Dict[str, str]]:
         try:
             ps_script = '''
@@ -42,17 +60,10 @@ class MediaDetector:
             }
             '''
             
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
+            status, output = self.session().call(ps_script, timeout=5, retries=1)
             
-            result = subprocess.run([
-                "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", 
-                "-WindowStyle", "Hidden", "-Command", ps_script
-            ], capture_output=True, text=True, timeout=5, startupinfo=startupinfo)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                line = result.stdout.strip().split('\n')[0]  
+            if status == 0 and output.strip():
+                line = output.strip().split('\n')[0]  
                 if '|' in line:
                     parts = line.split('|', 2)
                     if len(parts) >= 3:
@@ -67,7 +78,7 @@ class MediaDetector:
                                 'app': app
                             }
                             
-        except subprocess.TimeoutExpired:
+        except HelperProcessTimeout:
             return self._get_windows_media_simple()
         except Exception as e:
             print(f"Erro na detecção Windows: {e}")
@@ -76,33 +87,20 @@ class MediaDetector:
     
     def _get_windows_media_simple(self) -> Optional[Dict[str, str]]:
         try:
-            result = subprocess.run([
-                "tasklist", "/FI", "IMAGENAME eq Spotify.exe", "/FO", "CSV", "/V"
-            ], capture_output=True, text=True, timeout=3)
+            status, output = self.session().call(
+                'tasklist /FI "IMAGENAME eq Spotify.exe" /FO CSV /V', timeout=3, retries=1)
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
+            if status == 0:
+                lines = output.strip().split('\n')
                 for line in lines[1:]: 
                     if 'Spotify.exe' in line:
                         fields = line.split('","')
                         if len(fields) >= 9:
                             window_title = fields[-1].replace('"', '').strip()
-                            if (window_title and window_title != "N/A" and 
-                                window_title not in ["Spotify", "Spotify Free", "Spotify Premium"]):
-                                
-                                match = re.match(r'^(.+?)\s*[-–—]\s*(.+?)$', window_title)
-                                if match:
-                                    return {
-                                        'artist': match.group(1).strip(),
-                                        'title': match.group(2).strip(),
-                                        'app': 'Spotify'
-                                    }
-                                else:
-                                    return {
-                                        'artist': 'Unknown Artist',
-                                        'title': window_title,
-                                        'app': 'Spotify'
-                                    }
+                            if window_title != "N/A":
+                                media_info = parse_window_title(window_title)
+                                if media_info:
+                                    return media_info
                                     
         except Exception as e:
             print(f"Erro no método alternativo: {e}")
@@ -135,4 +133,9 @@ class MediaDetector:
         return self.get_current_media() is not None
     
     def clear_cache(self):
-        self._cache = {'data': None, 'timestamp': 0}
\ No newline at end of file
+        self._cache = {'data': None, 'timestamp': 0}
+    
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
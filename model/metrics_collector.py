@@ -0,0 +1,161 @@
+import time
+from array import array
+from typing import Callable, Dict, Optional
+
+import psutil
+
+from model.cpu_sampler import get_cpu_sampler
+from model.network_sampler import NetworkSampler
+from model.settings import get_setting
+
+# O QTimer pode disparar alguns ms antes; sem folga a série pularia um ciclo.
+DUE_SLACK = 0.1
+
+class RingBuffer:
+    # Array pré-alocado no construtor; append só sobrescreve a posição mais
+    # antiga, então a memória não cresce com o tempo ligado.
+    __slots__ = ("values", "capacity", "head", "count", "peak")
+
+    def __init__(self, capacity: int, typecode: str = "d"):
+        self.capacity = capacity
+        self.values = array(typecode, [0]) * capacity
+        self.head = 0
+        self.count = 0
+        self.peak = 0.0
+
+    def append(self, value: float):
+        overwritten = self.values[self.head] if self.count == self.capacity else None
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        if value >= self.peak:
+            self.peak = value
+        elif overwritten is not None and overwritten >= self.peak:
+            self.peak = max(self.values)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> float:
+        # Índice 0 é a amostra mais antiga ainda guardada.
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.values[(self.head - self.count + index) % self.capacity]
+
+    def last(self, default: float = 0.0) -> float:
+        return self.values[self.head - 1] if self.count else default
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.peak = 0.0
+
+class RateCounter:
+    # Converte um contador cumulativo (bytes) em taxa por segundo.
+    __slots__ = ("previous", "timestamp")
+
+    def __init__(self):
+        self.previous = None
+        self.timestamp = 0.0
+
+    def update(self, value: int, now: float) -> Optional[float]:
+        previous, timestamp = self.previous, self.timestamp
+        self.previous, self.timestamp = value, now
+        if previous is None or now <= timestamp or value < previous:
+            # Primeira leitura ou contador zerado (interface reiniciada).
+            return None
+        return (value - previous) / (now - timestamp)
+
+class Series:
+    __slots__ = ("name", "interval", "buffer", "probe", "due")
+
+    def __init__(self, name: str, interval: float, capacity: int, probe: Callable[[float], Optional[float]]):
+        self.name = name
+        self.interval = interval
+        self.buffer = RingBuffer(capacity)
+        self.probe = probe
+        self.due = 0.0
+
+class MetricsCollector:
+    # Cada série tem seu ritmo: collect() roda no timer de menor granularidade e
+    # só consulta as vencidas; as leituras do psutil usadas aqui não bloqueiam.
+    def __init__(self, history: int = None, intervals: Dict[str, float] = None):
+        # O sparkline divide por (capacidade - 1): no mínimo duas amostras.
+        history = max(2, int(history or get_setting("metrics", "history")))
+        intervals = intervals or {}
+        self.network = NetworkSampler(get_setting("network", "interfaces"), get_setting("network", "exclude"))
+        self._disk_read = RateCounter()
+        self._disk_write = RateCounter()
+
+        probes = {
+            "cpu": self._probe_cpu,
+            "ram": self._probe_ram,
+            "net_up": self._probe_net_up,
+            "net_down": self._probe_net_down,
+            "disk_read": self._probe_disk_read,
+            "disk_write": self._probe_disk_write,
+        }
+        self.series: Dict[str, Series] = {}
+        for name, probe in probes.items():
+            group = name.split("_")[0]
+            interval = intervals.get(group) or get_setting("metrics", f"{group}_interval")
+            self.series[name] = Series(name, interval, history, probe)
+
+        self._net_rates = None
+        self._net_sampled = False
+        self._disk_counters = None
+
+    def buffer(self, name: str) -> RingBuffer:
+        return self.series[name].buffer
+
+    def collect(self, now: float = None):
+        now = time.monotonic() if now is None else now
+        self._net_sampled = False
+        self._disk_counters = None
+        for series in self.series.values():
+            if now + DUE_SLACK < series.due:
+                continue
+            series.due = now + series.interval
+            try:
+                value = series.probe(now)
+            except Exception as e:
+                print(f"Erro ao coletar métrica {series.name}: {e}")
+                continue
+            if value is not None:
+                series.buffer.append(value)
+
+    def _probe_cpu(self, now: float) -> float:
+        return get_cpu_sampler("metrics").percent()
+
+    def _probe_ram(self, now: float) -> float:
+        return psutil.virtual_memory().percent
+
+    # Subida e descida (leitura e escrita) vêm da mesma chamada ao psutil;
+    # o resultado é reaproveitado dentro de um mesmo collect().
+    def _net(self, now: float):
+        if not self._net_sampled:
+            self._net_sampled = True
+            self._net_rates = self.network.sample(now)
+        return self._net_rates
+
+    def _disk(self):
+        if self._disk_counters is None:
+            self._disk_counters = psutil.disk_io_counters(nowrap=False)
+        return self._disk_counters
+
+    def _probe_net_up(self, now: float) -> Optional[float]:
+        rates = self._net(now)
+        return rates[0] if rates else None
+
+    def _probe_net_down(self, now: float) -> Optional[float]:
+        rates = self._net(now)
+        return rates[1] if rates else None
+
+    def _probe_disk_read(self, now: float) -> Optional[float]:
+        counters = self._disk()
+        return self._disk_read.update(counters.read_bytes, now) if counters else None
+
+    def _probe_disk_write(self, now: float) -> Optional[float]:
+        counters = self._disk()
+        return self._disk_write.update(counters.write_bytes, now) if counters else None
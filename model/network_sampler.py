@@ -0,0 +1,60 @@
+import time
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+class NetworkSampler:
+    # Subida e descida (bytes/s) somadas das interfaces escolhidas, comparando
+    # cada interface com a leitura anterior; interfaces novas ou com contador
+    # zerado só entram na soma a partir da leitura seguinte.
+    def __init__(self, interfaces: Optional[List[str]] = None, exclude: Optional[List[str]] = None):
+        self.interfaces = interfaces or []
+        self.exclude = exclude or []
+        self._selected: Dict[str, bool] = {}
+        self._previous: Dict[str, Tuple[int, int]] = {}
+        self._timestamp = 0.0
+        self.up = 0.0
+        self.down = 0.0
+
+    def selects(self, name: str) -> bool:
+        selected = self._selected.get(name)
+        if selected is None:
+            if self.interfaces:
+                selected = any(fnmatchcase(name, pattern) for pattern in self.interfaces)
+            else:
+                selected = True
+            if selected and self.exclude:
+                selected = not any(fnmatchcase(name, pattern) for pattern in self.exclude)
+            self._selected[name] = selected
+        return selected
+
+    def sample(self, now: float = None) -> Optional[Tuple[float, float]]:
+        # (subida, descida) desde a última chamada, ou None na primeira.
+        now = time.monotonic() if now is None else now
+        counters = psutil.net_io_counters(pernic=True, nowrap=False)
+        elapsed = now - self._timestamp
+        first = not self._previous
+
+        sent = recv = 0
+        previous = self._previous
+        current = {}
+        for name, stats in counters.items():
+            if not self.selects(name):
+                continue
+            current[name] = (stats.bytes_sent, stats.bytes_recv)
+            before = previous.get(name)
+            if before is None:
+                continue
+            if stats.bytes_sent >= before[0]:
+                sent += stats.bytes_sent - before[0]
+            if stats.bytes_recv >= before[1]:
+                recv += stats.bytes_recv - before[1]
+
+        self._previous = current
+        self._timestamp = now
+        if first or elapsed <= 0:
+            return None
+        self.up = sent / elapsed
+        self.down = recv / elapsed
+        return self.up, self.down
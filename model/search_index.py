@@ -0,0 +1,171 @@
+import re
+import heapq
+import unicodedata
+from typing import Callable, List, Optional, Tuple
+
+WORD_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+SCORE_EXACT = 1000
+SCORE_PREFIX = 900
+SCORE_WORD_PREFIX = 800
+SCORE_ACRONYM = 750
+SCORE_SUBSTRING = 600
+SCORE_SUBSEQUENCE = 400
+SUBSEQUENCE_CAP = 450
+MAX_BOOST = 80
+PREFIX_LENGTH = 3
+
+def fold(text: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+def make_acronym(name: str) -> str:
+    return ''.join(fold(word[0]) for word in WORD_PATTERN.findall(name))
+
+def word_starts(folded: str) -> frozenset:
+    starts = set()
+    previous_alnum = False
+    for i, c in enumerate(folded):
+        is_alnum = c.isalnum()
+        if is_alnum and not previous_alnum:
+            starts.add(i)
+        previous_alnum = is_alnum
+    return frozenset(starts)
+
+def subsequence_pattern(query: str):
+    return re.compile('.*?'.join(f'({re.escape(c)})' for c in query), re.DOTALL)
+
+class SearchIndex:
+    def __init__(self, items: list, key: Callable = lambda item: item.name,
+                 folded_key: Optional[Callable] = None):
+        self.items = items
+        self.names: List[str] = []
+        self.acronyms: List[str] = []
+        self.starts: List[frozenset] = []
+        self.char_sets = {}
+        self.prefix_lists = {}
+        self.initial_lists = {}
+
+        for i, item in enumerate(items):
+            name = key(item)
+            folded = folded_key(item) if folded_key else fold(name)
+            self.names.append(folded)
+            self.acronyms.append(make_acronym(name))
+            self.starts.append(word_starts(folded))
+            for c in set(folded):
+                self.char_sets.setdefault(c, set()).add(i)
+            for length in range(1, min(len(folded), PREFIX_LENGTH) + 1):
+                self.prefix_lists.setdefault(folded[:length], []).append(i)
+            for c in {folded[start] for start in self.starts[i]}:
+                self.initial_lists.setdefault(c, []).append(i)
+
+    def __len__(self):
+        return len(self.items)
+
+    def score(self, query: str, i: int, pattern=None) -> Optional[int]:
+        folded = self.names[i]
+        length_penalty = min(len(folded) - len(query), 50) // 5
+
+        position = folded.find(query)
+        if position == 0:
+            if len(folded) == len(query):
+                return SCORE_EXACT
+            return SCORE_PREFIX - length_penalty
+
+        starts = self.starts[i]
+        if position > 0:
+            first = position
+            while position >= 0:
+                if position in starts:
+                    return SCORE_WORD_PREFIX - length_penalty
+                position = folded.find(query, position + 1)
+            return SCORE_SUBSTRING - min(first, 40) - length_penalty
+
+        if self.acronyms[i].startswith(query):
+            return SCORE_ACRONYM - length_penalty
+
+        match = (pattern or subsequence_pattern(query)).search(folded)
+        if match is None:
+            return None
+
+        boundary_hits = 0
+        for group in range(1, len(query) + 1):
+            if match.start(group) in starts:
+                boundary_hits += 1
+        gaps = min(match.end() - len(query), 100)
+        score = min(SCORE_SUBSEQUENCE + boundary_hits * 20 - gaps, SUBSEQUENCE_CAP)
+        return score - length_penalty
+
+    def candidates(self, query: str):
+        sets = []
+        for c in set(query):
+            char_set = self.char_sets.get(c)
+            if not char_set:
+                return set()
+            sets.append(char_set)
+
+        if not sets:
+            return set(range(len(self.items)))
+
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def prefix_candidates(self, query: str) -> list:
+        bucket = self.prefix_lists.get(query[:PREFIX_LENGTH], ())
+        if len(query) <= PREFIX_LENGTH:
+            return bucket
+        return [i for i in bucket if self.names[i].startswith(query)]
+
+    def search(self, query: str, limit: int = 15, boost: Callable = None) -> list:
+        return self.search_with_matches(query, limit, boost)[0]
+
+    def search_with_matches(self, query: str, limit: int = 15, boost: Callable = None,
+                            candidates=None) -> Tuple[list, Optional[list]]:
+        query = fold(query.strip())
+        if not query:
+            return self.items[:limit], None
+
+        # Todas as categorias de match são subsequências do nome, então o
+        # conjunto de matches de uma consulta contém o de qualquer extensão
+        # dela; quem chama pode devolvê-lo em ``candidates`` para refinar.
+        complete = True
+        if candidates is None:
+            # Prefixos valem no mínimo SCORE_PREFIX - 10, acima de qualquer outra
+            # categoria mesmo com bônus máximo; se já bastam para o top-k, o resto
+            # do catálogo não precisa ser pontuado. Com um único caractere o mesmo
+            # vale para inícios de palavra, já que acrônimo aí implica prefixo.
+            candidates = self.prefix_candidates(query)
+            if len(candidates) < limit and len(query) == 1:
+                candidates = self.initial_lists.get(query, ())
+            if len(candidates) < limit:
+                candidates = self.candidates(query)
+            else:
+                complete = False
+
+        # Substring e acrônimo sempre superam subsequência (SUBSEQUENCE_CAP +
+        # MAX_BOOST fica abaixo do pior substring); havendo o suficiente deles,
+        # a verificação de subsequência é pulada e os candidatos seguem como
+        # superconjunto dos matches.
+        names = self.names
+        acronyms = self.acronyms
+        strong = [i for i in candidates if query in names[i] or acronyms[i].startswith(query)]
+        verified = len(strong) < limit
+        to_score = candidates if verified else strong
+
+        scored = []
+        matches = []
+        pattern = subsequence_pattern(query)
+        score_item = self.score
+        for i in to_score:
+            score = score_item(query, i, pattern)
+            if score is None:
+                continue
+            matches.append(i)
+            if boost:
+                score += max(0, min(boost(self.items[i]), MAX_BOOST))
+            scored.append((-score, names[i], i))
+
+        results = [self.items[i] for _, _, i in heapq.nsmallest(limit, scored)]
+        if not complete:
+            return results, None
+        return results, matches if verified else list(candidates)
@@ -0,0 +1,62 @@
+import os
+import json
+import copy
+from model.storage import get_data_dir
+
+DEFAULT_SETTINGS = {
+    "file_search": {
+        "roots": ["~/Documents", "~/Desktop", "~/Downloads"],
+        "depth": 3,
+        "poll_interval": 5.0,
+    },
+    "content_search": {
+        "enabled": True,
+        "extensions": None,
+        "max_file_size": 1024 * 1024,
+        "interval": 300.0,
+    },
+    "metrics": {
+        "history": 60,
+        "cpu_interval": 1.0,
+        "ram_interval": 2.0,
+        "net_interval": 1.0,
+        "disk_interval": 2.0,
+    },
+    "network": {
+        "interfaces": [],
+        "exclude": ["lo", "Loopback*", "vEthernet*", "docker*", "veth*"],
+    },
+}
+
+_settings = None
+
+def _merge(base: dict, override: dict) -> dict:
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+def load_settings() -> dict:
+    global _settings
+    if _settings is not None:
+        return _settings
+
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    path = os.path.join(get_data_dir(), "settings.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            user_settings = json.load(f)
+        if isinstance(user_settings, dict):
+            _merge(settings, user_settings)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Erro ao ler configurações {path}: {e}")
+
+    _settings = settings
+    return settings
+
+def get_setting(section: str, key: str):
+    return load_settings().get(section, {}).get(key, DEFAULT_SETTINGS.get(section, {}).get(key))
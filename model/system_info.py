@@ -2,6 +2,7 @@ import psutil
 from datetime import datetime
 import locale
 import platform
+from model.cpu_sampler import get_cpu_sampler
 
 class SystemInfo:
     _boot_time = None
@@ -46,7 +47,7 @@ class SystemInfo:
 
     @staticmethod
     def get_cpu_usage():
-        return psutil.cpu_percent(interval=0.5)
+        return get_cpu_sampler().percent()
 
     @staticmethod
     def get_ram_info():
@@ -64,8 +65,10 @@ class SystemInfo:
             cls._cpu_count = psutil.cpu_count()
         
         cpu_freq = psutil.cpu_freq()
+        reading = get_cpu_sampler().sample()
         return {
-            'percentage': psutil.cpu_percent(interval=0.5),
+            'percentage': reading.percent,
+            'per_core': reading.per_core,
             'cores': cls._cpu_count,
             'frequency': cpu_freq.current if cpu_freq else 0
         }
@@ -0,0 +1,93 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from typing import Optional
+
+TRACE_ENV = "RIWING_TRACE"
+DEFAULT_CAPACITY = 4096
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Optional[dict]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        self.tracer.events.append((self.name, "X", self.start // 1000, (end - self.start) // 1000,
+                                   threading.get_ident(), self.args))
+        return False
+
+class Tracer:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        # deque com maxlen funciona como buffer circular e append é atômico,
+        # então qualquer thread registra sem lock.
+        self.events = deque(maxlen=capacity)
+        self.enabled = enabled
+        self._thread_names = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return NULL_SPAN
+        self._thread_names.setdefault(threading.get_ident(), threading.current_thread().name)
+        return Span(self, name, args or None)
+
+    def instant(self, name: str, **args):
+        if not self.enabled:
+            return
+        self._thread_names.setdefault(threading.get_ident(), threading.current_thread().name)
+        self.events.append((name, "i", time.perf_counter_ns() // 1000, 0, threading.get_ident(), args or None))
+
+    def chrome_trace(self) -> dict:
+        pid = os.getpid()
+        trace_events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                        for tid, name in list(self._thread_names.items())]
+        for name, phase, ts, dur, tid, args in list(self.events):
+            event = {"name": name, "cat": "riwing", "ph": phase, "ts": ts, "pid": pid, "tid": tid}
+            if phase == "X":
+                event["dur"] = dur
+            else:
+                event["s"] = "t"
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str) -> int:
+        trace = self.chrome_trace()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        os.replace(tmp_path, path)
+        return len(trace["traceEvents"])
+
+_tracer = None
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(enabled=os.environ.get(TRACE_ENV, "") not in ("", "0"))
+    return _tracer
@@ -0,0 +1,34 @@
+import os
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+from model.file_watcher import PollingWatcher
+
+class PollingWatcherTest(unittest.TestCase):
+    def test_short_timeout_does_not_poll_before_interval(self):
+        with tempfile.TemporaryDirectory() as directory:
+            watcher = PollingWatcher(interval=0.5)
+            watcher.watch(directory)
+            open(os.path.join(directory, "novo"), "w").close()
+            with mock.patch("model.file_watcher.os.stat", wraps=os.stat) as stat:
+                started = time.monotonic()
+                changed = set()
+                while not changed and time.monotonic() - started < 2.0:
+                    changed = watcher.wait(timeout=0.05)
+                elapsed = time.monotonic() - started
+            self.assertEqual(changed, {directory})
+            self.assertGreaterEqual(elapsed, 0.4)
+            self.assertEqual(stat.call_count, 1)
+            watcher.close()
+
+    def test_close_interrupts_wait(self):
+        watcher = PollingWatcher(interval=60.0)
+        watcher.close()
+        started = time.monotonic()
+        self.assertEqual(watcher.wait(timeout=1.0), set())
+        self.assertLess(time.monotonic() - started, 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
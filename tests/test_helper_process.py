@@ -0,0 +1,70 @@
+import os
+import signal
+import tempfile
+import unittest
+
+from model.helper_process import HelperProcessSession, HelperProcessError, HelperProcessTimeout, PosixShell
+
+@unittest.skipUnless(os.path.exists("/bin/sh"), "requer /bin/sh")
+class HelperProcessSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.session = HelperProcessSession(PosixShell(), timeout=2.0)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_frames_output_and_status(self):
+        self.assertEqual(self.session.call("echo um; echo dois"), (0, "um\ndois\n"))
+        self.assertEqual(self.session.call("printf sem-quebra"), (0, "sem-quebra"))
+        self.assertEqual(self.session.call("false"), (1, ""))
+        self.assertEqual(self.session.call("X=5\nif [ $X -gt 3 ]; then\n  echo grande\nfi"), (0, "grande\n"))
+        self.assertTrue(self.session.ping())
+
+    def test_keeps_state_between_calls(self):
+        self.session.call("VALOR=42")
+        self.assertEqual(self.session.call("echo $VALOR"), (0, "42\n"))
+        self.assertEqual(self.session.restarts, 0)
+
+    def test_timeout_discards_process(self):
+        with self.assertRaises(HelperProcessTimeout):
+            self.session.call("sleep 5; echo tarde", timeout=0.2)
+        self.assertFalse(self.session.is_alive())
+        self.assertEqual(self.session.call("echo depois"), (0, "depois\n"))
+
+    def test_restarts_after_crash(self):
+        self.session.call("true")
+        os.kill(self.session._process.pid, signal.SIGKILL)
+        self.session._process.wait()
+        self.assertEqual(self.session.call("echo de volta"), (0, "de volta\n"))
+        self.assertEqual(self.session.restarts, 1)
+
+    def test_does_not_rerun_command_that_kills_shell(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log = os.path.join(directory, "runs")
+            with self.assertRaises(HelperProcessError):
+                self.session.call(f"echo x >> {log}; exit 3")
+            with open(log) as f:
+                self.assertEqual(f.read(), "x\n")
+        self.assertEqual(self.session.call("echo ok"), (0, "ok\n"))
+
+    def test_failed_init_leaves_no_stale_output(self):
+        dialect = PosixShell()
+        dialect.init = "sleep 1; echo resto-do-init"
+        session = HelperProcessSession(dialect, timeout=0.2)
+        try:
+            with self.assertRaises(HelperProcessTimeout):
+                session.call("echo primeiro")
+            self.assertFalse(session.is_alive())
+            dialect.init = ""
+            self.assertEqual(session.call("echo segundo"), (0, "segundo\n"))
+        finally:
+            session.close()
+
+    def test_missing_shell(self):
+        session = HelperProcessSession(PosixShell(["/nonexistent/sh"]))
+        with self.assertRaises(HelperProcessError):
+            session.call("echo x")
+        self.assertFalse(session.ping())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import json
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+from model import launch_history
+from model.launch_history import LaunchHistory
+
+class LaunchHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "launch_history.json")
+        self.history = LaunchHistory(self.path, flush_interval=3600)
+
+    def tearDown(self):
+        self.history.close()
+        self.directory.cleanup()
+
+    def test_top_follows_records(self):
+        now = time.time()
+        self.history.record("a", now - 60)
+        self.history.record("b", now - 30)
+        self.assertEqual(self.history.top(2, now), ["b", "a"])
+        self.history.record("a", now)
+        self.assertEqual(self.history.top(2, now), ["a", "b"])
+
+    def test_flush_drops_decayed_entries(self):
+        now = time.time()
+        self.history.record("antigo", now - 365 * 24 * 3600)
+        self.history.record("recente", now)
+        self.history.flush()
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(list(json.load(f)["entries"]), ["recente"])
+        self.assertEqual(self.history.top(5), ["recente"])
+
+    def test_flush_caps_entry_count(self):
+        now = time.time()
+        with mock.patch.object(launch_history, "MAX_ENTRIES", 3):
+            for i in range(5):
+                self.history.record(str(i), now - i)
+            self.history.flush()
+        self.assertEqual(self.history.top(10), ["0", "1", "2"])
+
+if __name__ == "__main__":
+    unittest.main()
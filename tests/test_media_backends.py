@@ -0,0 +1,157 @@
+import os
+import time
+import queue
+import shutil
+import tempfile
+import threading
+import subprocess
+import unittest
+
+from model.media_backends import MprisBackend, MPRIS_PATH, MPRIS_PLAYER, MPRIS_PREFIX, jeepney
+
+def wait_for(condition, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+class FakePlayer:
+    # Player MPRIS mínimo: responde GetAll e emite PropertiesChanged.
+    def __init__(self, address: str, name: str = "fake"):
+        self.address = address
+        self.bus_name = MPRIS_PREFIX + name
+        self.status = "Stopped"
+        self.metadata = {}
+        self._commands = queue.Queue()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait(3.0)
+
+    def play(self, artist: str, title: str):
+        self._commands.put(("Playing", artist, title))
+
+    def pause(self):
+        self._commands.put(("Paused", None, None))
+
+    def quit(self):
+        self._commands.put(None)
+        self._thread.join(3.0)
+
+    def _properties(self) -> dict:
+        return {"PlaybackStatus": ("s", self.status), "Metadata": ("a{sv}", self.metadata)}
+
+    def _serve(self):
+        from jeepney import DBusAddress, MessageType, HeaderFields, new_method_return, new_signal
+        from jeepney.bus_messages import message_bus
+        from jeepney.io.blocking import open_dbus_connection
+
+        conn = open_dbus_connection(bus=self.address)
+        conn.send_and_get_reply(message_bus.RequestName(self.bus_name))
+        emitter = DBusAddress(MPRIS_PATH, interface="org.freedesktop.DBus.Properties")
+        self._ready.set()
+        try:
+            while True:
+                try:
+                    command = self._commands.get_nowait()
+                except queue.Empty:
+                    command = False
+                if command is None:
+                    return
+                if command:
+                    self.status, artist, title = command
+                    if title:
+                        self.metadata = {"xesam:title": ("s", title), "xesam:artist": ("as", [artist])}
+                    conn.send(new_signal(emitter, "PropertiesChanged", "sa{sv}as",
+                                         (MPRIS_PLAYER, self._properties(), [])))
+                try:
+                    msg = conn.receive(timeout=0.02)
+                except TimeoutError:
+                    continue
+                fields = msg.header.fields
+                if msg.header.message_type == MessageType.method_call and fields.get(HeaderFields.member) == "GetAll":
+                    conn.send(new_method_return(msg, "a{sv}", (self._properties(),)))
+        finally:
+            conn.close()
+
+@unittest.skipIf(jeepney is None or shutil.which("dbus-daemon") is None, "requer jeepney e dbus-daemon")
+class MprisBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.runtime_dir = tempfile.mkdtemp(prefix="riwing-dbus-")
+        config = os.path.join(self.runtime_dir, "bus.conf")
+        with open(config, "w") as f:
+            f.write(f"""<busconfig>
+  <type>session</type>
+  <listen>unix:dir={self.runtime_dir}</listen>
+  <policy context="default">
+    <allow send_destination="*" eavesdrop="true"/>
+    <allow eavesdrop="true"/>
+    <allow own="*"/>
+  </policy>
+</busconfig>""")
+        self.daemon = subprocess.Popen(["dbus-daemon", f"--config-file={config}", "--nofork", "--print-address"],
+                                       stdout=subprocess.PIPE, text=True)
+        self.address = self.daemon.stdout.readline().strip()
+        self.updates = []
+        self.backend = None
+
+    def tearDown(self):
+        if self.backend:
+            self.backend.stop()
+        self.daemon.terminate()
+        self.daemon.wait(3.0)
+        shutil.rmtree(self.runtime_dir, ignore_errors=True)
+
+    def start_backend(self):
+        self.backend = MprisBackend(bus=self.address)
+        self.backend.subscribe(self.updates.append)
+        self.backend.start()
+
+    def test_follows_track_changes_and_player_exit(self):
+        player = FakePlayer(self.address)
+        player.start()
+        self.start_backend()
+
+        player.play("Artista", "Faixa 1")
+        self.assertTrue(wait_for(lambda: self.backend.current() is not None))
+        self.assertEqual(self.backend.current(), {'artist': 'Artista', 'title': 'Faixa 1', 'app': 'Fake'})
+
+        player.play("Artista", "Faixa 2")
+        self.assertTrue(wait_for(lambda: (self.backend.current() or {}).get('title') == "Faixa 2"))
+
+        player.pause()
+        self.assertTrue(wait_for(lambda: self.backend.current() is None))
+
+        player.play("Artista", "Faixa 3")
+        self.assertTrue(wait_for(lambda: self.backend.current() is not None))
+        player.quit()
+        self.assertTrue(wait_for(lambda: self.backend.current() is None))
+        self.assertEqual([info and info['title'] for info in self.updates],
+                         ["Faixa 1", "Faixa 2", None, "Faixa 3", None])
+
+    def test_reads_player_that_was_already_playing(self):
+        player = FakePlayer(self.address)
+        player.start()
+        player.play("Artista", "Já tocando")
+        time.sleep(0.1)
+        self.start_backend()
+        self.assertTrue(wait_for(lambda: self.backend.current() is not None))
+        self.assertEqual(self.backend.current()['title'], "Já tocando")
+        player.quit()
+
+class MprisFallbackTest(unittest.TestCase):
+    def test_polls_fallback_without_bus(self):
+        info = {'artist': 'Artista', 'title': 'Faixa', 'app': 'Spotify'}
+        backend = MprisBackend(bus="unix:path=/nonexistent/riwing-bus", fallback=lambda: info, interval=0.05)
+        backend.start()
+        try:
+            self.assertTrue(wait_for(lambda: backend.current() == info))
+        finally:
+            backend.stop()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,12 @@
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                             QLineEdit, QListWidget, QListWidgetItem, QLabel,
-                             QGraphicsDropShadowEffect, QMenu)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QKeySequence, QShortcut, QIcon, QPixmap, QColor, QAction
+                             QLineEdit, QLabel, QGraphicsDropShadowEffect)
+from PyQt6.QtCore import Qt, QTimer, QEvent, QPoint, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6.QtGui import QFont, QKeySequence, QShortcut, QColor
 from typing import List, Union
 from model.launcher_model import AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo
-import os
+from view.result_list import ResultListView
+from model.tracing import get_tracer
 import platform
-import subprocess
 import sys
 
 class OverlayWindow(QWidget):
@@ -19,95 +18,6 @@ class OverlayWindow(QWidget):
         self.setStyleSheet("background-color: rgba(0, 0, 0, 180);")
         self.showFullScreen()
 
-class CustomListWidget(QListWidget):
-    def __init__(self):
-        super().__init__()
-        self.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        
-    def create_item_widget(self, item_data) -> QListWidgetItem:
-        item = QListWidgetItem()
-        
-        if isinstance(item_data, AppInfo):
-            item.setText(item_data.name)
-            if item_data.icon_path and os.path.exists(item_data.icon_path):
-                icon = QIcon(item_data.icon_path)
-                item.setIcon(icon)
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
-            
-        elif isinstance(item_data, FileInfo):
-            size_str = self.format_file_size(item_data.size)
-            item.setText(f"📄 {item_data.name} ({size_str})")
-            item.setToolTip(item_data.path)
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
-            
-        elif hasattr(item_data, 'type') and item_data.type == "folder":
-            item.setText(f"📁 {item_data.name}")
-            item.setToolTip(item_data.path)
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
-            
-        elif isinstance(item_data, WebInfo):
-            item.setText(f"🌐 {item_data.name}")
-            item.setToolTip(item_data.url)
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
-            
-        elif isinstance(item_data, CommandInfo):
-            item.setText(f"> {item_data.name}")
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
-            
-        elif isinstance(item_data, MathInfo):
-            item.setText(f"> {item_data.name}")
-            item.setData(Qt.ItemDataRole.UserRole, item_data)
-            
-        return item
-    
-    def format_file_size(self, size_bytes: int) -> str:
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-        
-    def contextMenuEvent(self, event):
-        item = self.itemAt(event.pos())
-        if not item:
-            return
-
-        item_data = item.data(Qt.ItemDataRole.UserRole)
-        if isinstance(item_data, (AppInfo, FileInfo)):
-            menu = QMenu(self)
-            menu.setStyleSheet("""
-                QMenu {
-                    background-color: rgba(40, 40, 40, 240);
-                    color: white;
-                    border: 1px solid rgba(255, 255, 255, 40);
-                    padding: 4px;
-                    border-radius: 6px;
-                }
-                QMenu::item {
-                    padding: 6px 12px;
-                    background-color: transparent;
-                }
-                QMenu::item:selected {
-                    background-color: rgba(70, 130, 255, 90);
-                }
-            """)
-            
-            
-            open_folder_action = QAction("Abrir local do arquivo", self)
-            
-            def open_folder():
-                path = item_data.path
-                if os.path.exists(path):
-                    folder = os.path.dirname(path)
-                    subprocess.Popen(f'explorer /select,"{path}"')
-            
-            open_folder_action.triggered.connect(open_folder)
-            menu.addAction(open_folder_action)
-            menu.exec(event.globalPos())
-
 class LauncherView(QWidget):
     item_executed = pyqtSignal(object)
     search_requested = pyqtSignal(str)
@@ -115,6 +25,9 @@ class LauncherView(QWidget):
     def __init__(self):
         super().__init__()
         self.overlay = None
+        self.tracer = get_tracer()
+        self._screen_positions = {}
+        self._watched_screens = set()
         self.setup_ui()
         self.setup_shortcuts()
         self.setup_animations()
@@ -127,6 +40,7 @@ class LauncherView(QWidget):
             flags |= Qt.WindowType.X11BypassWindowManagerHint
             
         self.setWindowFlags(flags)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         
         if platform.system() != "Windows":
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -158,7 +72,7 @@ class LauncherView(QWidget):
                 border: 1px solid rgba(70, 130, 255, 120);
                 background-color: rgba(30, 30, 30, 220);
             }}
-            QListWidget {{
+            QListView {{
                 background-color: transparent;
                 border: none;
                 margin: 0px 16px 8px 16px;
@@ -166,21 +80,6 @@ class LauncherView(QWidget):
                 font-family: "Consolas", "Monaco", monospace;
                 font-size: 13px;
             }}
-            QListWidget::item {{
-                background-color: transparent;
-                border: none;
-                padding: 10px 14px;
-                margin: 1px 0px;
-                color: #ffffff;
-                border-radius: 4px;
-            }}
-            QListWidget::item:selected {{
-                background-color: rgba(70, 130, 255, 80);
-                color: #ffffff;
-            }}
-            QListWidget::item:hover {{
-                background-color: rgba(255, 255, 255, 15);
-            }}
             QLabel {{
                 color: rgba(255, 255, 255, 140);
                 font-size: 11px;
@@ -243,8 +142,8 @@ class LauncherView(QWidget):
         self.search_input.textChanged.connect(self.on_search_changed)
         self.search_input.returnPressed.connect(self.execute_selected)
         
-        self.results_list = CustomListWidget()
-        self.results_list.itemDoubleClicked.connect(self.execute_selected)
+        self.results_list = ResultListView()
+        self.results_list.item_activated.connect(self.execute_item)
         
         self.info_label = QLabel()
         self.update_info_label()
@@ -295,6 +194,7 @@ class LauncherView(QWidget):
             from pynput import keyboard
             
             def on_hotkey():
+                self.tracer.instant("hotkey")
                 QTimer.singleShot(0, self.toggle_visibility)
                 
             self.listener = keyboard.GlobalHotKeys({
@@ -308,54 +208,55 @@ class LauncherView(QWidget):
             self.toggle_shortcut.activated.connect(self.toggle_visibility)
     
     def center_window(self):
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 3
-        self.move(x, y)
+        screen = QApplication.primaryScreen()
+        position = self._screen_positions.get(screen.name())
+        if position is None:
+            geometry = screen.geometry()
+            position = QPoint((geometry.width() - self.width()) // 2,
+                              (geometry.height() - self.height()) // 3)
+            self._screen_positions[screen.name()] = position
+            if screen.name() not in self._watched_screens:
+                self._watched_screens.add(screen.name())
+                screen.geometryChanged.connect(self._screen_positions.clear)
+        if self.pos() != position:
+            self.move(position)
     
     def on_search_changed(self):
         query = self.search_input.text()
-        self.search_requested.emit(query)
+        with self.tracer.span("search_requested", query_length=len(query)):
+            self.search_requested.emit(query)
     
     def update_results(self, results: List[Union[AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo]]):
-        self.results_list.clear()
-        
-        for result in results[:12]:
-            item = self.results_list.create_item_widget(result)
-            self.results_list.addItem(item)
-        
-        if self.results_list.count() > 0:
-            self.results_list.setCurrentRow(0)
+        with self.tracer.span("update_results", count=len(results)):
+            self.results_list.set_results(results)
     
     def navigate_up(self):
-        current = self.results_list.currentRow()
+        current = self.results_list.current_row()
         if current > 0:
-            self.results_list.setCurrentRow(current - 1)
+            self.results_list.set_current_row(current - 1)
         elif self.results_list.count() > 0:
-            self.results_list.setCurrentRow(self.results_list.count() - 1)
+            self.results_list.set_current_row(self.results_list.count() - 1)
     
     def navigate_down(self):
-        current = self.results_list.currentRow()
+        current = self.results_list.current_row()
         if current < self.results_list.count() - 1:
-            self.results_list.setCurrentRow(current + 1)
+            self.results_list.set_current_row(current + 1)
         elif self.results_list.count() > 0:
-            self.results_list.setCurrentRow(0)
+            self.results_list.set_current_row(0)
     
     def autocomplete(self):
-        current_item = self.results_list.currentItem()
-        if current_item:
-            item_data = current_item.data(Qt.ItemDataRole.UserRole)
-            if isinstance(item_data, AppInfo):
-                app_name = item_data.name.lower().replace(" ", "")
-                self.search_input.setText(f".{app_name}")
+        item_data = self.results_list.current_item()
+        if isinstance(item_data, AppInfo):
+            app_name = item_data.name.lower().replace(" ", "")
+            self.search_input.setText(f".{app_name}")
     
     def execute_selected(self):
-        current_item = self.results_list.currentItem()
-        if current_item:
-            item_data = current_item.data(Qt.ItemDataRole.UserRole)
-            if item_data:
-                self.item_executed.emit(item_data)
-                self.hide_launcher()
+        self.execute_item(self.results_list.current_item())
+    
+    def execute_item(self, item_data):
+        if item_data:
+            self.item_executed.emit(item_data)
+            self.hide_launcher()
     
     def hide_launcher(self):
         if platform.system() == "Windows":
@@ -390,6 +291,7 @@ class LauncherView(QWidget):
             else:
                 self.overlay.show()
 
+        self.center_window()
         if platform.system() == "Windows":
             self.setWindowOpacity(1.0)
             self.show()
@@ -397,28 +299,38 @@ class LauncherView(QWidget):
             self.setWindowOpacity(0.0)
             self.show()
         
-        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-        
         self.raise_()
         self.activateWindow()
-        self.center_window()
-        self.search_input.clear()
+        self.force_focus(self.search_input)
         
         if platform.system() != "Windows":
             self.opacity_animation.setStartValue(0.0)
             self.opacity_animation.setEndValue(1.0)
             self.opacity_animation.start()
         
-        QTimer.singleShot(150, lambda: self.force_focus(self.search_input))
-        
-        self.search_requested.emit("")
+        # A lista padrão é preparada enquanto a janela está escondida; só é
+        # pedida aqui se ainda não chegou nenhum resultado.
+        if self.search_input.text():
+            self.search_input.clear()
+        elif self.results_list.count() == 0:
+            self.search_requested.emit("")
+        elif self.results_list.current_row() != 0:
+            self.results_list.set_current_row(0)
+            self.results_list.scrollToTop()
+    
+    def event(self, event):
+        # Se o sistema só entregar o foco depois de mostrar a janela, o campo de
+        # busca o recebe assim que ela for ativada, sem espera fixa.
+        if event.type() == QEvent.Type.WindowActivate and not self.search_input.hasFocus():
+            self.search_input.setFocus(Qt.FocusReason.ActiveWindowFocusReason)
+        return super().event(event)
         
     def toggle_visibility(self):
-        if self.isVisible():
-            self.hide_launcher()
-        else:
-            self.show_launcher()
+        with self.tracer.span("toggle_visibility"):
+            if self.isVisible():
+                self.hide_launcher()
+            else:
+                self.show_launcher()
     
     def closeEvent(self, event):
         event.ignore()
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Optional
+from PyQt6.QtGui import QIcon, QPixmap
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+MISSING_COST = 64
+
+class PixmapCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def icon(self, path: str) -> Optional[QIcon]:
+        entry = self._entries.get(path)
+        if entry is not None:
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            icon, cost = None, MISSING_COST
+        else:
+            icon = QIcon(pixmap)
+            cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+        self._entries[path] = (icon, cost)
+        self.total_bytes += cost
+        self._evict()
+        return icon
+
+    def invalidate(self, path: str):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self.total_bytes -= cost
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+_shared_cache = None
+
+def get_pixmap_cache() -> PixmapCache:
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = PixmapCache()
+    return _shared_cache
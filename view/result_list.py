@@ -0,0 +1,290 @@
+import os
+import subprocess
+from typing import List, Optional
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QMenu
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QColor, QIcon, QPainter, QPixmap
+from model.launcher_model import AppInfo, FileInfo, WebInfo, CommandInfo, MathInfo
+from view.pixmap_cache import get_pixmap_cache
+from model.tracing import get_tracer
+
+MAX_RESULTS = 500
+ROW_HEIGHT = 40
+ICON_SIZE = 20
+SELECTED_COLOR = QColor(70, 130, 255, 80)
+HOVER_COLOR = QColor(255, 255, 255, 15)
+TEXT_COLOR = QColor(255, 255, 255)
+
+def format_file_size(size_bytes: int) -> str:
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    elif size_bytes < 1024 * 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+    else:
+        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+
+def result_key(item) -> tuple:
+    if isinstance(item, WebInfo):
+        return (item.type, item.url)
+    if isinstance(item, CommandInfo):
+        return (item.type, item.command)
+    if isinstance(item, MathInfo):
+        return (item.type, item.expression, item.result)
+    return (item.type, getattr(item, 'path', item.name))
+
+def display_text(item) -> str:
+    if isinstance(item, AppInfo):
+        return item.name
+    if isinstance(item, FileInfo):
+        return f"📄 {item.name} ({format_file_size(item.size)})"
+    if getattr(item, 'type', None) == "folder":
+        return f"📁 {item.name}"
+    if isinstance(item, WebInfo):
+        return f"🌐 {item.name}"
+    return f"> {item.name}"
+
+def tooltip_text(item) -> Optional[str]:
+    if isinstance(item, WebInfo):
+        return item.url
+    if isinstance(item, FileInfo) or getattr(item, 'type', None) == "folder":
+        return item.path
+    return None
+
+class ResultListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pixmap_cache = get_pixmap_cache()
+        self._items = []
+        self._keys = []
+        self._texts = []
+        self._placeholder_icon = None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def item(self, row: int):
+        return self._items[row] if 0 <= row < len(self._items) else None
+
+    def key(self, row: int) -> Optional[tuple]:
+        return self._keys[row] if 0 <= row < len(self._keys) else None
+
+    def row_of(self, key: tuple) -> int:
+        try:
+            return self._keys.index(key)
+        except ValueError:
+            return -1
+
+    def placeholder_icon(self) -> QIcon:
+        if self._placeholder_icon is None:
+            pixmap = QPixmap(32, 32)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            self._placeholder_icon = QIcon(pixmap)
+        return self._placeholder_icon
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self._items):
+            return None
+
+        item = self._items[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[row]
+        if role == Qt.ItemDataRole.DecorationRole:
+            if not isinstance(item, AppInfo):
+                return None
+            icon = self.pixmap_cache.icon(item.icon_path) if item.icon_path else None
+            return icon or self.placeholder_icon()
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tooltip_text(item)
+        if role == Qt.ItemDataRole.UserRole:
+            return item
+        return None
+
+    def set_results(self, results: list):
+        results = results[:MAX_RESULTS]
+        keys = [result_key(item) for item in results]
+        old_keys = self._keys
+
+        # Só o trecho entre o prefixo e o sufixo em comum é removido e
+        # reinserido; as linhas iguais continuam onde estão.
+        start = 0
+        limit = min(len(keys), len(old_keys))
+        while start < limit and keys[start] == old_keys[start]:
+            start += 1
+        end_old = len(old_keys)
+        end_new = len(keys)
+        while end_old > start and end_new > start and keys[end_new - 1] == old_keys[end_old - 1]:
+            end_old -= 1
+            end_new -= 1
+
+        if end_old > start:
+            self.beginRemoveRows(QModelIndex(), start, end_old - 1)
+            del self._items[start:end_old]
+            del self._keys[start:end_old]
+            del self._texts[start:end_old]
+            self.endRemoveRows()
+
+        if end_new > start:
+            self.beginInsertRows(QModelIndex(), start, end_new - 1)
+            self._items[start:start] = results[start:end_new]
+            self._keys[start:start] = keys[start:end_new]
+            self._texts[start:start] = [display_text(item) for item in results[start:end_new]]
+            self.endInsertRows()
+
+        # Linhas reaproveitadas podem trazer objetos novos com o mesmo conteúdo
+        # (ex.: tamanho de arquivo atualizado); o texto é refeito só se mudou.
+        for row in list(range(start)) + list(range(end_new, len(keys))):
+            item = results[row]
+            if item is self._items[row]:
+                continue
+            self._items[row] = item
+            text = display_text(item)
+            if text != self._texts[row]:
+                self._texts[row] = text
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def icon_ready(self, app_path: str, icon_path: str):
+        self.pixmap_cache.invalidate(icon_path)
+        for row, item in enumerate(self._items):
+            if isinstance(item, AppInfo) and item.path == app_path:
+                item.icon_path = icon_path
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+class ResultDelegate(QStyledItemDelegate):
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        rect = option.rect.adjusted(0, 1, 0, -1)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setBrush(SELECTED_COLOR)
+            painter.drawRoundedRect(rect, 4, 4)
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            painter.setBrush(HOVER_COLOR)
+            painter.drawRoundedRect(rect, 4, 4)
+
+        text_left = rect.left() + 14
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if icon is not None:
+            icon_rect = QRect(text_left, rect.top() + (rect.height() - ICON_SIZE) // 2, ICON_SIZE, ICON_SIZE)
+            icon.paint(painter, icon_rect)
+            text_left += ICON_SIZE + 8
+
+        text_rect = QRect(text_left, rect.top(), rect.right() - 14 - text_left, rect.height())
+        text = option.fontMetrics.elidedText(index.data(Qt.ItemDataRole.DisplayRole) or "",
+                                             Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.setPen(TEXT_COLOR)
+        painter.setFont(option.font)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+        painter.restore()
+
+class ResultListView(QListView):
+    item_activated = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.results_model = ResultListModel(self)
+        self.setModel(self.results_model)
+        self.setItemDelegate(ResultDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.icon_loader = None
+        self.tracer = get_tracer()
+        self.verticalScrollBar().valueChanged.connect(self.request_visible_icons)
+        self.doubleClicked.connect(lambda index: self.item_activated.emit(index.data(Qt.ItemDataRole.UserRole)))
+
+    def set_icon_loader(self, icon_loader):
+        self.icon_loader = icon_loader
+        icon_loader.icon_ready.connect(self.results_model.icon_ready)
+
+    def count(self) -> int:
+        return self.results_model.rowCount()
+
+    def current_row(self) -> int:
+        return self.currentIndex().row()
+
+    def set_current_row(self, row: int):
+        self.setCurrentIndex(self.results_model.index(row))
+
+    def current_item(self):
+        return self.results_model.item(self.current_row())
+
+    def set_results(self, results: list):
+        previous_row = self.current_row()
+        previous_key = self.results_model.key(previous_row)
+
+        self.results_model.set_results(results)
+
+        # A seleção acompanha o item escolhido se ele continuar na lista;
+        # quem estava no topo continua no topo.
+        row = self.results_model.row_of(previous_key) if previous_row > 0 else -1
+        if row < 0 and self.count() > 0:
+            row = 0
+        if row >= 0:
+            self.set_current_row(row)
+            self.scrollTo(self.results_model.index(row))
+
+        QTimer.singleShot(0, self.request_visible_icons)
+
+    def paintEvent(self, event):
+        with self.tracer.span("paint", rows=self.count()):
+            super().paintEvent(event)
+
+    def request_visible_icons(self):
+        if not self.icon_loader or self.count() == 0:
+            return
+
+        viewport = self.viewport().rect()
+        first = self.indexAt(viewport.topLeft()).row()
+        last = self.indexAt(viewport.bottomLeft()).row()
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = self.count() - 1
+
+        for row in range(first, last + 1):
+            item_data = self.results_model.item(row)
+            if isinstance(item_data, AppInfo) and not item_data.icon_path:
+                self.icon_loader.request(item_data)
+
+    def contextMenuEvent(self, event):
+        item_data = self.indexAt(event.pos()).data(Qt.ItemDataRole.UserRole)
+        if isinstance(item_data, (AppInfo, FileInfo)):
+            menu = QMenu(self)
+            menu.setStyleSheet("""
+                QMenu {
+                    background-color: rgba(40, 40, 40, 240);
+                    color: white;
+                    border: 1px solid rgba(255, 255, 255, 40);
+                    padding: 4px;
+                    border-radius: 6px;
+                }
+                QMenu::item {
+                    padding: 6px 12px;
+                    background-color: transparent;
+                }
+                QMenu::item:selected {
+                    background-color: rgba(70, 130, 255, 90);
+                }
+            """)
+
+
+            open_folder_action = QAction("Abrir local do arquivo", self)
+
+            def open_folder():
+                path = item_data.path
+                if os.path.exists(path):
+                    subprocess.Popen(f'explorer /select,"{path}"')
+
+            open_folder_action.triggered.connect(open_folder)
+            menu.addAction(open_folder_action)
+            menu.exec(event.globalPos())
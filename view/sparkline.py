@@ -0,0 +1,58 @@
+from typing import Optional
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, QSize
+from PyQt6.QtGui import QColor, QPainter, QPen
+from model.metrics_collector import RingBuffer
+
+DEFAULT_SIZE = QSize(48, 16)
+LINE_COLOR = QColor(255, 255, 255, 160)
+
+class Sparkline(QWidget):
+    # Lê direto de um RingBuffer: os pontos são criados quando o buffer é ligado
+    # e a pintura só atualiza coordenadas, sem montar listas por quadro.
+    def __init__(self, maximum: Optional[float] = None, color: QColor = LINE_COLOR, parent=None):
+        super().__init__(parent)
+        self.maximum = maximum
+        self.buffer: Optional[RingBuffer] = None
+        self._points = []
+        self._pen = QPen(color, 1.2)
+        self.setFixedSize(DEFAULT_SIZE)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+
+    def set_buffer(self, buffer: RingBuffer):
+        self.buffer = buffer
+        self._points = [QPointF() for _ in range(buffer.capacity)]
+        self.update()
+
+    def set_color(self, color: str):
+        if self._pen.color().name() != color:
+            pen_color = QColor(color)
+            pen_color.setAlpha(LINE_COLOR.alpha())
+            self._pen.setColor(pen_color)
+            self.update()
+
+    def paintEvent(self, event):
+        buffer = self.buffer
+        count = len(buffer) if buffer is not None else 0
+        if count < 2:
+            return
+
+        # Percentuais usam escala fixa; taxas escalam pelo pico da janela.
+        top = self.maximum or buffer.peak or 1.0
+        width = self.width() - 1
+        height = self.height() - 2
+        step = width / (buffer.capacity - 1)
+        offset = width - step * (count - 1)
+        points = self._points
+        for i in range(count):
+            value = min(buffer[i], top)
+            point = points[i]
+            point.setX(offset + step * i)
+            point.setY(1 + height - value / top * height)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._pen)
+        for i in range(1, count):
+            painter.drawLine(points[i - 1], points[i])
+        painter.end()
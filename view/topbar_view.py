@@ -2,6 +2,8 @@ from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QFontMetrics, QGuiApplication
 import platform
+from view.sparkline import Sparkline
+from model.system_info import SystemInfo
 
 class TopBar(QWidget):
     def __init__(self):
@@ -62,6 +64,10 @@ class TopBar(QWidget):
         self.time_label = QLabel("22:24:28")
         self.ram_label = QLabel("RAM 66%")
         self.cpu_label = QLabel("CPU 43%")
+        self.net_label = QLabel("↓ 0.0 B/s ↑ 0.0 B/s")
+        self.net_sparkline = Sparkline()
+        self.ram_sparkline = Sparkline(maximum=100.0)
+        self.cpu_sparkline = Sparkline(maximum=100.0)
         
         self.media_label = QLabel("")
         self.media_label.setFont(font)
@@ -75,11 +81,18 @@ class TopBar(QWidget):
         self.media_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.media_label.hide()  
         
-        labels = [self.date_label, self.time_label, self.ram_label, self.cpu_label]
+        labels = [self.date_label, self.time_label, self.net_label, self.ram_label, self.cpu_label]
         for label in labels:
             label.setFont(font)
             label.setStyleSheet(self._base_label_style)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Largura do maior texto que format_bytes devolve (ex.: "1023.9 MB"),
+        # para o rótulo não mudar de tamanho quando a taxa troca de unidade.
+        metrics = QFontMetrics(font)
+        widest = max(("1023.9 B", "1023.9 KB", "1023.9 MB", "1023.9 GB", "1023.9 TB", "1023.9 PB"),
+                     key=metrics.horizontalAdvance)
+        self.net_label.setMinimumWidth(metrics.horizontalAdvance(f"↓ {widest}/s ↑ {widest}/s") + 24)
 
         content_layout = QHBoxLayout()
         content_layout.setContentsMargins(12, 0, 12, 0)
@@ -104,8 +117,12 @@ class TopBar(QWidget):
         separator_right.setStyleSheet("color: rgba(255, 255, 255, 100); padding: 6px 4px;")
         content_layout.addWidget(separator_right)
         
+        content_layout.addWidget(self.net_label)
+        content_layout.addWidget(self.net_sparkline)
         content_layout.addWidget(self.ram_label)
+        content_layout.addWidget(self.ram_sparkline)
         content_layout.addWidget(self.cpu_label)
+        content_layout.addWidget(self.cpu_sparkline)
         
         self.background_widget.setLayout(content_layout)
         self.setLayout(main_layout)
@@ -247,11 +264,26 @@ class TopBar(QWidget):
         color = self._get_usage_color(percentage)
         self.ram_label.setText(f"RAM {percentage:.0f}%")
         self._update_label_color(self.ram_label, color)
+        self.ram_sparkline.set_color(color)
 
     def update_cpu_usage(self, percentage):
         color = self._get_usage_color(percentage)
         self.cpu_label.setText(f"CPU {percentage:.0f}%")
         self._update_label_color(self.cpu_label, color)
+        self.cpu_sparkline.set_color(color)
+
+    def set_metrics(self, metrics):
+        self.net_sparkline.set_buffer(metrics.buffer("net_down"))
+        self.ram_sparkline.set_buffer(metrics.buffer("ram"))
+        self.cpu_sparkline.set_buffer(metrics.buffer("cpu"))
+
+    def refresh_sparklines(self):
+        self.net_sparkline.update()
+        self.ram_sparkline.update()
+        self.cpu_sparkline.update()
+
+    def update_network(self, up: float, down: float):
+        self.net_label.setText(f"↓ {SystemInfo.format_bytes(down)}/s ↑ {SystemInfo.format_bytes(up)}/s")
 
     def update_media_info(self, media_text: str):
         if media_text and media_text.strip():
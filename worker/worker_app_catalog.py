@@ -0,0 +1,95 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt6.QtCore import QObject, pyqtSignal
+from model.launcher_model import REGISTRY_PATHS, START_MENU_PATHS, app_folded
+from model.search_index import SearchIndex
+
+SHORTCUT_BATCH_SIZE = 16
+# Intervalo mínimo entre parciais: cada uma reconstrói o índice inteiro.
+PARTIAL_INTERVAL = 0.15
+
+def init_com():
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass
+
+class AppCatalogWorker(QObject):
+    partial = pyqtSignal(list, object)
+    result = pyqtSignal(list, object)
+
+    def __init__(self, model, max_workers: int = 6):
+        super().__init__()
+        self.model = model
+        self.max_workers = max_workers
+
+    def run(self):
+        try:
+            apps = self.discover()
+            self.model.snapshot.save(apps)
+            self.result.emit(apps, SearchIndex(apps, folded_key=app_folded))
+            self.model.icon_store.compact()
+        except Exception as e:
+            print(f"[AppCatalogWorker] Erro: {e}")
+            self.result.emit([], None)
+
+    def discover(self):
+        # Cada tarefa recebe um índice de ordem para que a deduplicação final
+        # preserve a prioridade sistema > registry > menu iniciar.
+        found = {}
+        seen_paths = set()
+        streamed = []
+        last_partial = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, initializer=init_com) as pool:
+            futures = {pool.submit(self.model.get_system_apps): (0,)}
+            for index, (hkey, subkey_path) in enumerate(REGISTRY_PATHS):
+                futures[pool.submit(self.model.scan_registry_path, hkey, subkey_path)] = (1, index)
+            for index, start_path in enumerate(START_MENU_PATHS):
+                futures[pool.submit(self.model.find_shortcuts, start_path)] = ("walk", index)
+
+            pending = set(futures)
+            while pending:
+                for future in as_completed(list(pending)):
+                    pending.discard(future)
+                    key = futures[future]
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        print(f"[AppCatalogWorker] Erro na descoberta: {e}")
+                        continue
+
+                    if key[0] == "walk":
+                        for start in range(0, len(value), SHORTCUT_BATCH_SIZE):
+                            batch = value[start:start + SHORTCUT_BATCH_SIZE]
+                            batch_future = pool.submit(self.resolve_shortcuts, batch)
+                            futures[batch_future] = (2, key[1], start)
+                            pending.add(batch_future)
+                        break
+
+                    found[key] = value
+                    for app in value:
+                        real_path = os.path.realpath(app.path).lower()
+                        if real_path not in seen_paths and os.path.exists(app.path):
+                            seen_paths.add(real_path)
+                            streamed.append(app)
+                    now = time.monotonic()
+                    if streamed and (last_partial is None or now - last_partial >= PARTIAL_INTERVAL):
+                        last_partial = now
+                        partial = sorted(streamed, key=lambda x: x.folded)
+                        self.partial.emit(partial, SearchIndex(partial, folded_key=app_folded))
+
+        apps = []
+        for key in sorted(found):
+            apps.extend(found[key])
+        return self.model.deduplicate_apps(apps)
+
+    def resolve_shortcuts(self, shortcut_paths):
+        apps = []
+        for shortcut_path in shortcut_paths:
+            app_info = self.model.resolve_cached_shortcut(shortcut_path)
+            if app_info:
+                apps.append(app_info)
+        return apps
@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, pyqtSignal
+from worker.worker_app_catalog import init_com
+
+class IconLoader(QObject):
+    icon_ready = pyqtSignal(str, str)
+
+    def __init__(self, model, max_workers: int = 2):
+        super().__init__()
+        self.model = model
+        # A extração de ícones usa APIs de shell/COM, que exigem COM
+        # inicializado em cada thread do pool.
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, initializer=init_com)
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._failed = set()
+
+    def request(self, app_info):
+        if app_info.icon_path:
+            return
+
+        path = app_info.path
+        with self._lock:
+            if path in self._pending or path in self._failed:
+                return
+            self._pending.add(path)
+
+        self.executor.submit(self._load, app_info)
+
+    def _load(self, app_info):
+        path = app_info.path
+        icon_path = None
+        try:
+            icon_path = self.model.extract_icon(path)
+        except Exception as e:
+            print(f"[IconLoader] Erro: {e}")
+
+        with self._lock:
+            self._pending.discard(path)
+            if not icon_path:
+                self._failed.add(path)
+
+        if icon_path:
+            app_info.icon_path = icon_path
+            self.icon_ready.emit(path, icon_path)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)